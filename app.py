@@ -7,6 +7,7 @@ Provides a web interface to view backtest results, recommendations, and analysis
 import os
 import json
 import glob
+import functools
 from datetime import datetime, timedelta
 from flask import Flask, render_template, jsonify, request, send_from_directory
 from flask_cors import CORS
@@ -70,6 +71,12 @@ def load_recommendations(symbol, date):
             return json.load(f)
     return None
 
+@functools.lru_cache(maxsize=1024)
+def _load_json_snapshot(filepath, mtime_ns, size):
+    """Parse a JSON file once per (mtime, size) version; callers must not mutate the result."""
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
 def load_historical_data(symbol):
     """Load historical price data for a symbol."""
     filename = f"{symbol}_historical.json"
@@ -233,9 +240,20 @@ def api_backtest(symbol, date):
 @app.route('/api/recommendations/<symbol>/<date>')
 def api_recommendations(symbol, date):
     """API endpoint to get recommendations."""
-    recommendations = load_recommendations(symbol, date)
+    filepath = os.path.join(RESULTS_DIR, f"{symbol}_recommendations_{date}.json")
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return jsonify({'error': 'Recommendations not found'}), 404
+    
+    # Keyed on the file version, so regenerated or removed files are never served stale
+    recommendations = _load_json_snapshot(filepath, stat.st_mtime_ns, stat.st_size)
     if recommendations:
-        return jsonify(recommendations)
+        response = jsonify(recommendations)
+        response.set_etag(f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+        response.cache_control.public = True
+        response.cache_control.no_cache = True  # clients revalidate via If-None-Match
+        return response.make_conditional(request)
     return jsonify({'error': 'Recommendations not found'}), 404
 
 @app.route('/api/historical/<symbol>')
@@ -246,6 +264,13 @@ def api_historical(symbol):
         return jsonify(data)
     return jsonify({'error': 'Historical data not found'}), 404
 
+@app.route('/api/ticker_status/<symbol>')
+def api_ticker_status(symbol):
+    """API endpoint to check whether a ticker is currently tracked."""
+    symbol = symbol.upper().strip()
+    exists = os.path.exists(os.path.join(CACHE_DIR, f'{symbol}_historical.json'))
+    return jsonify({'symbol': symbol, 'exists': exists})
+
 @app.route('/api/add_ticker', methods=['POST'])
 def add_ticker():
     """Add a new ticker to the system."""
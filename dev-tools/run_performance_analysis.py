@@ -9,7 +9,9 @@ It's designed to be called after the daily recommendations are generated.
 import os
 import sys
 import json
-from datetime import datetime
+import functools
+import tempfile
+from datetime import date
 
 # Add the src directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -20,7 +22,17 @@ from performance.config import (
     AUTO_GENERATE_TRIGGERS, REPORT_PATH
 )
 
-def run_daily_performance_analysis():
+# Summary line templates and lookup tables, built once per process
+_RISK_EMOJI = {"LOW": "🟢", "MEDIUM": "🟡", "HIGH": "🔴"}
+TRIGGER_FMT = "  {emoji} **{symbol}** {action} ({confidence:.0%} confidence, {risk} risk)"
+STRATEGY_FMT = "  {emoji} **{name}**: {accuracy:.1%} accuracy, {win_rate:.1%} win rate ({total} predictions)"
+
+@functools.lru_cache(maxsize=1)
+def _get_tracker():
+    """Return the process-wide PredictionTracker"""
+    return PredictionTracker(DATABASE_PATH)
+
+def run_daily_performance_analysis(tracker=None):
     """Run the daily prediction performance analysis"""
     if not INTEGRATE_WITH_DAILY_WORKFLOW:
         print("🚫 Daily performance analysis is disabled in config")
@@ -30,7 +42,7 @@ def run_daily_performance_analysis():
     
     try:
         # Initialize tracker
-        tracker = PredictionTracker(DATABASE_PATH)
+        tracker = tracker or _get_tracker()
         
         # Import any new recommendations from today
         imported = tracker.import_historical_predictions()
@@ -46,16 +58,21 @@ def run_daily_performance_analysis():
             triggers = tracker.generate_trading_triggers()
             print(f"🎯 Generated {len(triggers)} trading triggers")
             
-        # Generate performance report
-        report = tracker.generate_performance_report()
-        
         # Save report
-        today = datetime.now().strftime('%Y%m%d')
+        today = date.today().strftime('%Y%m%d')
         report_path = REPORT_PATH.format(date=today)
         os.makedirs(os.path.dirname(report_path), exist_ok=True)
         
-        with open(report_path, 'w') as f:
-            f.write(report)
+        # Generate performance report, streaming encoded lines to a temp file that
+        # only replaces today's report once it's complete
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(report_path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.writelines(tracker.iter_performance_report())
+            os.replace(tmp_path, report_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
             
         print(f"📄 Performance report saved to: {report_path}")
         
@@ -75,39 +92,44 @@ def run_daily_performance_analysis():
             "error": str(e)
         }
 
-def get_trading_triggers_summary():
+def get_trading_triggers_summary(tracker=None):
     """Get a summary of active trading triggers for the daily report"""
     try:
-        tracker = PredictionTracker(DATABASE_PATH)
-        triggers = tracker.get_active_triggers()
+        tracker = tracker or _get_tracker()
+        total = tracker.count_active_triggers()
         
-        if not triggers:
+        if not total:
             return "No active trading triggers."
             
-        summary = []
-        summary.append(f"🎯 **{len(triggers)} Active Trading Triggers:**")
-        
-        for trigger in triggers[:5]:  # Show top 5
-            risk_emoji = {"LOW": "🟢", "MEDIUM": "🟡", "HIGH": "🔴"}
-            emoji = risk_emoji.get(trigger.risk_level, "⚪")
+        # Only the rows that are rendered are loaded
+        triggers = tracker.get_active_triggers(limit=5)
             
-            summary.append(
-                f"  {emoji} **{trigger.symbol}** {trigger.action} "
-                f"({trigger.confidence:.0%} confidence, {trigger.risk_level} risk)"
+        summary = []
+        summary.append(f"🎯 **{total} Active Trading Triggers:**")
+        
+        summary.extend(
+            TRIGGER_FMT.format(
+                emoji=_RISK_EMOJI.get(trigger.risk_level, "⚪"),
+                symbol=trigger.symbol,
+                action=trigger.action,
+                confidence=trigger.confidence,
+                risk=trigger.risk_level
             )
+            for trigger in triggers  # Show top 5
+        )
             
-        if len(triggers) > 5:
-            summary.append(f"  ... and {len(triggers) - 5} more")
+        if total > 5:
+            summary.append(f"  ... and {total - 5} more")
             
         return "\n".join(summary)
         
     except Exception as e:
         return f"Error getting trading triggers: {e}"
 
-def get_strategy_performance_summary():
+def get_strategy_performance_summary(tracker=None):
     """Get a summary of strategy performance for the daily report"""
     try:
-        tracker = PredictionTracker(DATABASE_PATH)
+        tracker = tracker or _get_tracker()
         performance = tracker.calculate_strategy_performance()
         
         if not performance:
@@ -120,12 +142,16 @@ def get_strategy_performance_summary():
         summary = []
         summary.append("📈 **Strategy Performance (Top 3):**")
         
-        for name, perf in sorted_strategies[:3]:
-            accuracy_emoji = "🎯" if perf.accuracy_rate >= 0.7 else "📊" if perf.accuracy_rate >= 0.6 else "📉"
-            summary.append(
-                f"  {accuracy_emoji} **{name}**: {perf.accuracy_rate:.1%} accuracy, "
-                f"{perf.win_rate:.1%} win rate ({perf.total_predictions} predictions)"
+        summary.extend(
+            STRATEGY_FMT.format(
+                emoji="🎯" if perf.accuracy_rate >= 0.7 else "📊" if perf.accuracy_rate >= 0.6 else "📉",
+                name=name,
+                accuracy=perf.accuracy_rate,
+                win_rate=perf.win_rate,
+                total=perf.total_predictions
             )
+            for name, perf in sorted_strategies[:3]
+        )
             
         return "\n".join(summary)
         
@@ -133,8 +159,9 @@ def get_strategy_performance_summary():
         return f"Error getting strategy performance: {e}"
 
 if __name__ == "__main__":
-    # Run the daily analysis
-    result = run_daily_performance_analysis()
+    # Run the daily analysis, sharing one tracker across all steps
+    tracker = _get_tracker()
+    result = run_daily_performance_analysis(tracker)
     
     if result["status"] == "success":
         print("✅ Daily prediction performance analysis completed successfully")
@@ -143,12 +170,12 @@ if __name__ == "__main__":
         print("\n" + "="*50)
         print("TRADING TRIGGERS SUMMARY")
         print("="*50)
-        print(get_trading_triggers_summary())
+        print(get_trading_triggers_summary(tracker))
         
         print("\n" + "="*50)  
         print("STRATEGY PERFORMANCE SUMMARY")
         print("="*50)
-        print(get_strategy_performance_summary())
+        print(get_strategy_performance_summary(tracker))
         
     else:
         print(f"❌ Daily analysis failed: {result['error']}")
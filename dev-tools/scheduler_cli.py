@@ -5,19 +5,23 @@ CLI wrapper for the daily scheduler system
 import sys
 import os
 import argparse
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from scheduler.daily_scheduler import DailyScheduler
+# Scheduler modules pull in pandas/numpy and the strategy stack, so they are
+# imported inside the commands that need them to keep --help and status fast.
 
 
 def cmd_run(args):
     """Run daily workflow for a specific date"""
+    from scheduler.daily_scheduler import DailyScheduler
     scheduler = DailyScheduler()
     
-    date = datetime.strptime(args.date, '%Y-%m-%d') if args.date else datetime.now()
+    date = datetime.fromisoformat(args.date) if args.date else datetime.now()
     
     print(f"Running daily workflow for {date.date()}")
     print("=" * 50)
@@ -57,10 +61,11 @@ def cmd_run(args):
 
 def cmd_backfill(args):
     """Run backfill for a date range"""
+    from scheduler.daily_scheduler import DailyScheduler
     scheduler = DailyScheduler()
     
-    start_date = datetime.strptime(args.start_date, '%Y-%m-%d')
-    end_date = datetime.strptime(args.end_date, '%Y-%m-%d')
+    start_date = datetime.fromisoformat(args.start_date)
+    end_date = datetime.fromisoformat(args.end_date)
     
     print(f"Running backfill from {start_date.date()} to {end_date.date()}")
     print("=" * 50)
@@ -80,68 +85,83 @@ def cmd_status(args):
     print("=" * 30)
     
     # Check if logs directory exists
-    if os.path.exists('logs'):
-        log_files = [f for f in os.listdir('logs') if f.endswith('.log')]
-        print(f"Log files: {len(log_files)}")
+    if os.path.isdir('logs'):
+        with os.scandir('logs') as it:
+            log_entries = {e.name: e for e in it if e.name.endswith('.log')}
+        print(f"Log files: {len(log_entries)}")
         
         # Check for recent log activity
-        if 'daily_scheduler.log' in log_files:
-            log_path = 'logs/daily_scheduler.log'
-            stat = os.stat(log_path)
+        if 'daily_scheduler.log' in log_entries:
+            stat = log_entries['daily_scheduler.log'].stat()
             last_modified = datetime.fromtimestamp(stat.st_mtime)
             print(f"Last scheduler activity: {last_modified.strftime('%Y-%m-%d %H:%M:%S')}")
     else:
         print("No logs directory found")
     
     # Check if reports directory exists
-    if os.path.exists('reports'):
-        report_files = [f for f in os.listdir('reports') if f.startswith('daily_report_')]
+    if os.path.isdir('reports'):
+        with os.scandir('reports') as it:
+            report_files = [e.name for e in it if e.name.startswith('daily_report_')]
         print(f"Generated reports: {len(report_files)}")
         
         if report_files:
-            # Show recent reports
-            report_files.sort(reverse=True)
+            # Show recent reports (file names embed the date, so name order is date order)
             print("\nRecent reports:")
-            for report in report_files[:5]:
+            for report in heapq.nlargest(5, report_files):
                 print(f"  - {report}")
     else:
         print("No reports directory found")
 
 
+def _probe_config():
+    from config.config_manager import ConfigManager
+    config = ConfigManager().get_config()
+    enabled_symbols = [s.symbol for s in config.symbols if s.enabled]
+    return f"Configuration loaded: {len(enabled_symbols)} enabled symbols"
+
+
+def _probe_database():
+    from storage.timeseries_db import TimeSeriesDB
+    stats = TimeSeriesDB().get_database_stats()
+    return f"Database connected: {stats['total_records']} records"
+
+
+def _probe_aggregator():
+    from analysis.aggregation import DataAggregator
+    DataAggregator()
+    return "Data aggregator initialized"
+
+
+def _probe_strategy_runner():
+    from scheduler.daily_scheduler import StrategyRunner
+    StrategyRunner()
+    return "Strategy runner initialized"
+
+
 def cmd_test(args):
     """Test scheduler components"""
     print("🧪 Testing scheduler components")
     print("=" * 35)
     
-    try:
-        # Test configuration loading
-        from config.config_manager import ConfigManager
-        config_manager = ConfigManager()
-        config = config_manager.get_config()
-        enabled_symbols = [s.symbol for s in config.symbols if s.enabled]
-        print(f"✅ Configuration loaded: {len(enabled_symbols)} enabled symbols")
-        
-        # Test database connection
-        from storage.timeseries_db import TimeSeriesDB
-        db = TimeSeriesDB()
-        stats = db.get_database_stats()
-        print(f"✅ Database connected: {stats['total_records']} records")
-        
-        # Test data aggregator
-        from analysis.aggregation import DataAggregator
-        aggregator = DataAggregator()
-        print(f"✅ Data aggregator initialized")
-        
-        # Test strategy runner with sample data
-        from scheduler.daily_scheduler import StrategyRunner
-        strategy_runner = StrategyRunner()
-        print(f"✅ Strategy runner initialized")
-        
-        print("\n🎉 All components tested successfully!")
+    # The component probes are independent, so run them side by side and
+    # report in a fixed order once they have all finished
+    probes = [_probe_config, _probe_database, _probe_aggregator, _probe_strategy_runner]
+    failed = False
     
-    except Exception as e:
-        print(f"❌ Component test failed: {e}")
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = [executor.submit(probe) for probe in probes]
+        
+        for future in futures:
+            try:
+                print(f"✅ {future.result()}")
+            except Exception as e:
+                print(f"❌ Component test failed: {e}")
+                failed = True
+    
+    if failed:
         sys.exit(1)
+    
+    print("\n🎉 All components tested successfully!")
 
 
 def main():
@@ -5,7 +5,6 @@ Start the Flask web server for Stock Analysis Dashboard.
 
 import sys
 import os
-import subprocess
 import argparse
 
 def check_dependencies():
@@ -21,14 +20,9 @@ def check_dependencies():
     
     if missing:
         print(f"Missing required packages: {', '.join(missing)}")
-        print("Installing packages...")
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install'] + missing, check=True)
-            print("Packages installed successfully!")
-        except subprocess.CalledProcessError:
-            print("Failed to install packages. Please install manually:")
-            print(f"pip install {' '.join(missing)}")
-            return False
+        print("Please install them into your environment and retry:")
+        print(f"pip install {' '.join(missing)}")
+        return False
     
     return True
 
@@ -75,14 +69,13 @@ def main():
         try:
             import webbrowser
             import threading
-            import time
             
-            def open_browser():
-                time.sleep(1.5)  # Wait for server to start
-                url = f"http://localhost:{args.port}" if args.host == '0.0.0.0' else f"http://{args.host}:{args.port}"
-                webbrowser.open(url)
+            url = f"http://localhost:{args.port}" if args.host == '0.0.0.0' else f"http://{args.host}:{args.port}"
             
-            threading.Thread(target=open_browser, daemon=True).start()
+            # Wait for the server to start before opening the page
+            timer = threading.Timer(1.5, webbrowser.open, args=(url,))
+            timer.daemon = True
+            timer.start()
         except Exception as e:
             print(f"Could not open browser automatically: {e}")
     
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for the backtest result cache keys
+"""
+import sys
+import os
+import tempfile
+from datetime import datetime
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from market_data.market_data_storage import MarketDataStorage
+from market_data.data_types import HistoricalData, BacktestResult, TradeMetrics
+
+
+def make_history(closes):
+    """Build a small daily history with the given closing prices"""
+    return HistoricalData.from_dict({
+        'symbol': 'TEST',
+        'data_points': [
+            {'date': f'2024-01-{day:02d}', 'open': close, 'high': close, 'low': close,
+             'close': close, 'volume': 1000}
+            for day, close in enumerate(closes, start=2)
+        ]
+    })
+
+
+def test_backtest_cache():
+    """A corrected bar anywhere in the history must miss the cache"""
+    storage = MarketDataStorage(tempfile.mkdtemp())
+    start_date, end_date = datetime(2024, 1, 1), datetime(2024, 1, 31)
+    parameters = {'stop_loss': 0.08, 'profit_target': 0.15}
+    result = BacktestResult([], TradeMetrics(0.1, 0.1, 0, 0.0), {}, 0)
+
+    closes = [100.0, 101.0, 102.0, 103.0, 104.0]
+    storage.save_backtest('TEST', 'Trend Following', start_date, end_date,
+                          make_history(closes), result, parameters)
+
+    # Same data and parameters hit
+    assert storage.get_backtest('TEST', 'Trend Following', start_date, end_date,
+                                make_history(closes), parameters) is not None
+    print("✅ Unchanged history hits the cache")
+
+    # A middle bar corrected while the tail stays the same misses
+    corrected = list(closes)
+    corrected[2] = 98.5
+    assert storage.get_backtest('TEST', 'Trend Following', start_date, end_date,
+                                make_history(corrected), parameters) is None
+    print("✅ Corrected middle bar misses the cache")
+
+    # Changed strategy parameters miss
+    assert storage.get_backtest('TEST', 'Trend Following', start_date, end_date,
+                                make_history(closes), {**parameters, 'stop_loss': 0.05}) is None
+    print("✅ Changed strategy parameters miss the cache")
+
+
+if __name__ == "__main__":
+    test_backtest_cache()
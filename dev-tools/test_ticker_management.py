@@ -10,12 +10,26 @@ import time
 
 BASE_URL = "http://127.0.0.1:8090"
 
+# One keep-alive session for the whole run so every test reuses the same connection
+session = requests.Session()
+
+def wait_ready(symbol, expect_exists, timeout=2.0, interval=0.025):
+    """Poll the ticker status endpoint until the ticker is (or is not) present."""
+    deadline = time.monotonic() + timeout
+    while True:
+        response = session.get(f"{BASE_URL}/api/ticker_status/{symbol}")
+        if response.status_code == 200 and response.json().get('exists') == expect_exists:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
 def test_add_ticker(symbol):
     """Test adding a new ticker."""
     print(f"\n🔹 Testing ADD ticker: {symbol}")
     
-    response = requests.post(f"{BASE_URL}/api/add_ticker", 
-                           json={"symbol": symbol})
+    response = session.post(f"{BASE_URL}/api/add_ticker", 
+                          json={"symbol": symbol})
     
     if response.status_code == 200:
         result = response.json()
@@ -34,8 +48,8 @@ def test_remove_ticker(symbol):
     """Test removing a ticker."""
     print(f"\n🔹 Testing REMOVE ticker: {symbol}")
     
-    response = requests.post(f"{BASE_URL}/api/remove_ticker", 
-                           json={"symbol": symbol})
+    response = session.post(f"{BASE_URL}/api/remove_ticker", 
+                          json={"symbol": symbol})
     
     if response.status_code == 200:
         result = response.json()
@@ -54,8 +68,8 @@ def test_duplicate_add(symbol):
     """Test adding a duplicate ticker."""
     print(f"\n🔹 Testing DUPLICATE add: {symbol}")
     
-    response = requests.post(f"{BASE_URL}/api/add_ticker", 
-                           json={"symbol": symbol})
+    response = session.post(f"{BASE_URL}/api/add_ticker", 
+                          json={"symbol": symbol})
     
     result = response.json()
     if response.status_code == 400 and not result.get('success'):
@@ -70,8 +84,8 @@ def test_invalid_remove(symbol):
     """Test removing a non-existent ticker."""
     print(f"\n🔹 Testing INVALID remove: {symbol}")
     
-    response = requests.post(f"{BASE_URL}/api/remove_ticker", 
-                           json={"symbol": symbol}")
+    response = session.post(f"{BASE_URL}/api/remove_ticker", 
+                          json={"symbol": symbol})
     
     result = response.json()
     if response.status_code == 404 and not result.get('success'):
@@ -86,7 +100,7 @@ def test_recommendations_api(symbol):
     """Test that recommendations API works for new ticker."""
     print(f"\n🔹 Testing RECOMMENDATIONS API: {symbol}")
     
-    response = requests.get(f"{BASE_URL}/api/recommendations/{symbol}/20250524")
+    response = session.get(f"{BASE_URL}/api/recommendations/{symbol}/20250524")
     
     if response.status_code == 200:
         result = response.json()
@@ -115,31 +129,25 @@ def main():
         if test_add_ticker(test_symbol):
             tests_passed += 1
             
-        time.sleep(1)  # Brief pause between tests
+        wait_ready(test_symbol, expect_exists=True)
         
         # Test 2: Try adding duplicate (should fail)
         if test_duplicate_add(test_symbol):
             tests_passed += 1
-            
-        time.sleep(1)
         
         # Test 3: Test recommendations API
         if test_recommendations_api(test_symbol):
             tests_passed += 1
-            
-        time.sleep(1)
         
         # Test 4: Remove the ticker
         if test_remove_ticker(test_symbol):
             tests_passed += 1
             
-        time.sleep(1)
+        wait_ready(test_symbol, expect_exists=False)
         
         # Test 5: Try removing non-existent ticker (should fail)
         if test_invalid_remove(invalid_symbol):
             tests_passed += 1
-            
-        time.sleep(1)
         
         # Test 6: Try removing already removed ticker (should fail)
         if test_invalid_remove(test_symbol):
@@ -153,6 +161,9 @@ def main():
         print(f"❌ Unexpected error: {e}")
         return
     
+    finally:
+        session.close()
+    
     # Summary
     print("\n" + "=" * 50)
     print(f"📊 Test Results: {tests_passed}/{total_tests} tests passed")
@@ -165,6 +176,7 @@ def main():
     print("\n📋 Available API Endpoints:")
     print("   - POST /api/add_ticker")
     print("   - POST /api/remove_ticker")
+    print("   - GET /api/ticker_status/{symbol}")
     print("   - GET /api/recommendations/{symbol}/{date}")
     print("   - GET /api/backtest/{symbol}/{date}")
     print("\n🌐 Dashboard: http://127.0.0.1:8090")
@@ -18,15 +18,9 @@ def main():
     
     print(f"Original symbols: {symbols_list}")
     
-    # Clean up the symbols list
-    cleaned_symbols = []
-    seen = set()
-    
-    for symbol in symbols_list:
-        # Remove duplicates and invalid symbols
-        if symbol not in seen and symbol != "ETF":  # ETF is not a valid ticker symbol
-            cleaned_symbols.append(symbol)
-            seen.add(symbol)
+    # Clean up the symbols list: drop duplicates (keeping first-seen order)
+    # and invalid symbols - ETF is not a valid ticker symbol
+    cleaned_symbols = list(dict.fromkeys(s for s in symbols_list if s != "ETF"))
     
     print(f"Cleaned symbols ({len(cleaned_symbols)}): {cleaned_symbols}")
     
@@ -39,28 +33,25 @@ def main():
     # Update configuration
     config_manager = ConfigManager()
     
-    # Clear existing symbols
-    config_manager.clear_symbols()
-    
-    # Add tech stocks with priority 1
-    for symbol in tech_stocks:
-        if symbol in cleaned_symbols:
-            config_manager.add_symbol(symbol, priority=1, sector="Technology")
-    
-    # Add consumer stocks with priority 1  
-    for symbol in consumer_stocks:
-        if symbol in cleaned_symbols:
-            config_manager.add_symbol(symbol, priority=1, sector="Consumer")
-    
-    # Add ETFs with priority 2
-    for symbol in etfs:
-        if symbol in cleaned_symbols:
-            config_manager.add_symbol(symbol, priority=2, sector="ETF")
+    # Clear existing symbols (in memory only; saved once below)
+    config_manager.clear_symbols(save=False)
     
-    # Add mutual funds with priority 3
-    for symbol in mutual_funds:
-        if symbol in cleaned_symbols:
-            config_manager.add_symbol(symbol, priority=3, sector="Mutual Fund")
+    # Build every (symbol, sector, priority) row up front and add them in one batch:
+    # tech and consumer stocks at priority 1, ETFs at 2, mutual funds at 3
+    cleaned_set = set(cleaned_symbols)
+    categories = [
+        (tech_stocks, "Technology", 1),
+        (consumer_stocks, "Consumer", 1),
+        (etfs, "ETF", 2),
+        (mutual_funds, "Mutual Fund", 3),
+    ]
+    rows = [
+        (symbol, sector, priority)
+        for category, sector, priority in categories
+        for symbol in category
+        if symbol in cleaned_set
+    ]
+    config_manager.add_symbols(rows, save=False)
     
     # Save configuration
     success = config_manager.save_config()
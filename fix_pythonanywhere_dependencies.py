@@ -11,19 +11,27 @@ This script fixes the dependency issues on PythonAnywhere by:
 import subprocess
 import sys
 import os
+from collections import deque
 
 def run_command(command, description):
-    """Run a command and handle errors"""
+    """Run a command, streaming its output, and handle errors"""
     print(f"🔧 {description}...")
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
+        # Stream output line by line; only the tail is kept for the error summary
+        process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, bufsize=1)
+        tail = deque(maxlen=5)
+        for line in process.stdout:
+            line = line.rstrip()
+            if line:
+                print(f"   {line}")
+                tail.append(line)
+        
+        if process.wait() == 0:
             print(f"✅ {description} completed successfully")
-            if result.stdout.strip():
-                print(f"   Output: {result.stdout.strip()[-200:]}")  # Last 200 chars
         else:
             print(f"❌ {description} failed")
-            print(f"   Error: {result.stderr.strip()}")
+            print(f"   Error: {' | '.join(tail)}")
             return False
     except Exception as e:
         print(f"❌ {description} failed with exception: {e}")
@@ -40,22 +48,21 @@ def fix_dependencies():
     # Upgrade pip first
     run_command("pip3.10 install --user --upgrade pip", "Upgrading pip")
     
-    # Fix numexpr version (for pandas warning)
-    run_command("pip3.10 install --user --upgrade 'numexpr>=2.8.4'", "Upgrading numexpr")
-    
-    # Fix yfinance version (for YFRateLimitError import)
-    run_command("pip3.10 install --user --upgrade 'yfinance>=0.2.18'", "Upgrading yfinance")
-    
-    # Ensure other critical dependencies are current
+    # Upgrade everything in one pip call so the resolver runs once over the full set:
+    # numexpr for the pandas warning, yfinance for the YFRateLimitError import,
+    # plus the other critical dependencies
     dependencies = [
+        "numexpr>=2.8.4",
+        "yfinance>=0.2.18",
         "pandas>=2.0.0",
         "numpy>=1.24.0", 
         "requests>=2.28.0",
         "python-dateutil>=2.8.0"
     ]
     
-    for dep in dependencies:
-        run_command(f"pip3.10 install --user --upgrade '{dep}'", f"Upgrading {dep.split('>=')[0]}")
+    requirements = " ".join(f"'{dep}'" for dep in dependencies)
+    run_command(f"pip3.10 install --user --upgrade {requirements}",
+                f"Upgrading {', '.join(dep.split('>=')[0] for dep in dependencies)}")
     
     print()
     print("✅ Dependency fixes completed!")
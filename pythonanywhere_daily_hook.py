@@ -94,6 +94,9 @@ class PythonAnywhereSchedulerHook:
         self.scheduler = DailyScheduler()
         self.config_manager = ConfigManager()
         
+        # Cache of trading-day checks; the answer for a given date never changes
+        self._should_run_cache: dict = {}
+        
     def should_run_today(self, target_date: date = None) -> tuple[bool, str]:
         """
         Check if we should run the scheduler today
@@ -102,6 +105,12 @@ class PythonAnywhereSchedulerHook:
         if target_date is None:
             target_date = date.today()
         
+        if target_date not in self._should_run_cache:
+            self._should_run_cache[target_date] = self._check_trading_day(target_date)
+        return self._should_run_cache[target_date]
+    
+    def _check_trading_day(self, target_date: date) -> tuple[bool, str]:
+        """Evaluate the market calendar for a date"""
         # Check if it's a trading day
         if not self.market_calendar.is_trading_day(target_date):
             return False, f"{target_date} is not a trading day (weekend or holiday)"
@@ -234,25 +243,24 @@ class PythonAnywhereSchedulerHook:
                 logger.info("Prediction performance analysis is disabled in config")
                 return {'status': 'disabled', 'reason': 'Disabled in config'}
             
-            # Initialize tracker
-            tracker = PredictionTracker(DATABASE_PATH)
-            
-            # Import any new recommendations from today
-            imported = tracker.import_historical_predictions()
-            logger.info(f"Imported {imported} new predictions")
-            
-            # Update prediction outcomes
-            updated = tracker.update_prediction_outcomes()
-            logger.info(f"Updated {updated} prediction outcomes")
-            
-            # Generate trading triggers if enabled
-            triggers = []
-            if AUTO_GENERATE_TRIGGERS:
-                triggers = tracker.generate_trading_triggers()
-                logger.info(f"Generated {len(triggers)} trading triggers")
-            
-            # Generate performance report
-            report = tracker.generate_performance_report()
+            # Initialize tracker; the with block closes its connection even on errors
+            with PredictionTracker(DATABASE_PATH) as tracker:
+                # Import any new recommendations from today
+                imported = tracker.import_historical_predictions()
+                logger.info(f"Imported {imported} new predictions")
+                
+                # Update prediction outcomes
+                updated = tracker.update_prediction_outcomes()
+                logger.info(f"Updated {updated} prediction outcomes")
+                
+                # Generate trading triggers if enabled
+                triggers = []
+                if AUTO_GENERATE_TRIGGERS:
+                    triggers = tracker.generate_trading_triggers()
+                    logger.info(f"Generated {len(triggers)} trading triggers")
+                
+                # Generate performance report
+                report = tracker.generate_performance_report()
             
             # Save report
             today = datetime.now().strftime('%Y%m%d')
@@ -321,33 +329,40 @@ class PythonAnywhereSchedulerHook:
                 logger.info(f"Running {period_name} backtests...")
                 comprehensive_results['backtests'][period_name] = {}
                 
+                # Load every symbol's data for the period once; all strategies share it
+                try:
+                    period_data = db.get_multi_symbol_data(
+                        symbols,
+                        start_date.strftime('%Y-%m-%d'),
+                        end_date.strftime('%Y-%m-%d')
+                    )
+                except Exception as e:
+                    error_msg = f"Loading data failed for {period_name}: {str(e)}"
+                    logger.error(error_msg)
+                    comprehensive_results['errors'].append(error_msg)
+                    continue
+                
+                historical_data = {}
+                for symbol, symbol_data in period_data.items():
+                    if symbol_data and len(symbol_data) > 10:
+                        # Convert to the format expected by strategies
+                        data_points = [
+                            DataPoint(
+                                date=d.date,
+                                open=d.open,
+                                high=d.high,
+                                low=d.low,
+                                close=d.close,
+                                volume=d.volume
+                            ) for d in symbol_data
+                        ]
+                        historical_data[symbol] = HistoricalData(
+                            symbol=symbol,
+                            data_points=data_points
+                        )
+                
                 for strategy_name, strategy_class in strategies.items():
                     try:
-                        # Get historical data for all symbols
-                        historical_data = {}
-                        for symbol in symbols:
-                            symbol_data = db.get_symbol_data(
-                                symbol, 
-                                start_date.strftime('%Y-%m-%d'), 
-                                end_date.strftime('%Y-%m-%d')
-                            )
-                            if symbol_data and len(symbol_data) > 10:
-                                # Convert to the format expected by strategies
-                                data_points = [
-                                    DataPoint(
-                                        date=d.date,
-                                        open=d.open,
-                                        high=d.high,
-                                        low=d.low,
-                                        close=d.close,
-                                        volume=d.volume
-                                    ) for d in symbol_data
-                                ]
-                                historical_data[symbol] = HistoricalData(
-                                    symbol=symbol,
-                                    data_points=data_points
-                                )
-                        
                         if historical_data:
                             # Initialize strategy with data
                             strategy = strategy_class(list(historical_data.keys()), historical_data)
@@ -424,7 +439,7 @@ class PythonAnywhereSchedulerHook:
                     for symbol, result in strategy_results.items():
                         backtest_file = results_dir / f"{symbol}_backtest_{strategy_name}_{period_name}_{date_str}.json"
                         with open(backtest_file, 'w') as f:
-                            json.dump(result.__dict__ if hasattr(result, '__dict__') else result, f, indent=2, default=str)
+                            json.dump(result.to_dict() if hasattr(result, 'to_dict') else result, f, indent=2, default=str)
             
             # Save recommendations
             recommendations_file = results_dir / f"recommendations_{date_str}.json"
@@ -785,7 +800,7 @@ class PythonAnywhereSchedulerHook:
             # 5. Data gap detection (quick check)
             try:
                 # Simple gap detection - check if we have data for the last 5 trading days
-                market_cal = MarketCalendar(MarketType.NYSE)
+                market_cal = self.market_calendar
                 today = date.today()
                 gap_count = 0
                 
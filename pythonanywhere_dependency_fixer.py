@@ -6,31 +6,49 @@ Fix the dependency issues preventing the daily hook from running
 
 import subprocess
 import sys
+import threading
+from collections import deque
 
-def run_command(command, description):
-    """Run a shell command and handle errors"""
+def run_command(command, description, timeout=300):
+    """Run a shell command, streaming its output, and handle errors"""
     print(f"🔧 {description}...")
     try:
-        result = subprocess.run(
+        # Stream output line by line; only the tail is kept for the error summary
+        process = subprocess.Popen(
             command,
             shell=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300
+            bufsize=1
         )
         
-        if result.returncode == 0:
+        # Reading the pipe blocks, so enforce the timeout by killing the process
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+        try:
+            tail = deque(maxlen=5)
+            for line in process.stdout:
+                line = line.rstrip()
+                if line:
+                    print(f"   {line}")
+                    tail.append(line)
+            returncode = process.wait()
+        finally:
+            timed_out = not timer.is_alive()
+            timer.cancel()
+        
+        if timed_out:
+            print(f"❌ {description} timed out")
+            return False
+        
+        if returncode == 0:
             print(f"✅ {description} completed successfully")
-            if result.stdout.strip():
-                print(f"   Output: {result.stdout.strip()[-200:]}")  # Last 200 chars
         else:
             print(f"❌ {description} failed")
-            print(f"   Error: {result.stderr}")
+            print(f"   Error: {' | '.join(tail)}")
             return False
             
-    except subprocess.TimeoutExpired:
-        print(f"❌ {description} timed out")
-        return False
     except Exception as e:
         print(f"❌ {description} failed with exception: {e}")
         return False
@@ -42,15 +60,22 @@ def main():
     print("=" * 40)
     print()
     
-    # List of commands to run
+    # Packages to upgrade; they go through a single pip call so the resolver runs once
+    dependencies = [
+        "numexpr>=2.8.4",
+        "yfinance>=0.2.60",
+        "pandas>=2.0.0",
+        "numpy>=1.24.0",
+        "requests>=2.28.0",
+        "python-dateutil>=2.8.0",
+    ]
+    requirements = " ".join(f"'{dep}'" for dep in dependencies)
+    
+    # List of commands to run (pip itself is upgraded first)
     commands = [
         ("python3.10 -m pip install --user --upgrade pip", "Upgrading pip"),
-        ("python3.10 -m pip install --user --upgrade 'numexpr>=2.8.4'", "Upgrading numexpr"),
-        ("python3.10 -m pip install --user --upgrade 'yfinance>=0.2.60'", "Upgrading yfinance"),
-        ("python3.10 -m pip install --user --upgrade 'pandas>=2.0.0'", "Upgrading pandas"),
-        ("python3.10 -m pip install --user --upgrade 'numpy>=1.24.0'", "Upgrading numpy"),
-        ("python3.10 -m pip install --user --upgrade 'requests>=2.28.0'", "Upgrading requests"),
-        ("python3.10 -m pip install --user --upgrade 'python-dateutil>=2.8.0'", "Upgrading python-dateutil"),
+        (f"python3.10 -m pip install --user --upgrade {requirements}",
+         f"Upgrading {', '.join(dep.split('>=')[0] for dep in dependencies)}"),
     ]
     
     success_count = 0
@@ -8,8 +8,10 @@ without requiring console access.
 
 import sys
 import os
+import functools
+from importlib.util import find_spec
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, date
 
 # Ensure we're in the correct directory
 script_dir = Path(__file__).parent.absolute()
@@ -17,6 +19,12 @@ os.chdir(script_dir)
 src_path = script_dir / 'src'
 sys.path.insert(0, str(src_path))
 
+@functools.lru_cache(maxsize=1)
+def _get_hook():
+    """Build the scheduler hook once; repeat calls from the web interface reuse it"""
+    from pythonanywhere_daily_hook import PythonAnywhereSchedulerHook
+    return PythonAnywhereSchedulerHook()
+
 def quick_test():
     """Quick test that can be called from web interface"""
     
@@ -27,9 +35,18 @@ def quick_test():
     }
     
     try:
-        # Test 1: Basic imports
+        # Test 1: Basic imports (locate the modules without executing them;
+        # the real import happens when the hook is initialized below)
         try:
-            from pythonanywhere_daily_hook import PythonAnywhereSchedulerHook
+            modules = (
+                "pythonanywhere_daily_hook",
+                "market_calendar.market_calendar",
+                "scheduler.daily_scheduler",
+                "config.config_manager",
+            )
+            missing = [name for name in modules if find_spec(name) is None]
+            if missing:
+                raise ImportError(f"Modules not found: {', '.join(missing)}")
             result['tests']['imports'] = 'SUCCESS'
         except Exception as e:
             result['tests']['imports'] = f'FAILED: {str(e)}'
@@ -38,7 +55,7 @@ def quick_test():
         
         # Test 2: Hook initialization
         try:
-            hook = PythonAnywhereSchedulerHook()
+            hook = _get_hook()
             result['tests']['initialization'] = 'SUCCESS'
         except Exception as e:
             result['tests']['initialization'] = f'FAILED: {str(e)}'
@@ -47,7 +64,6 @@ def quick_test():
         
         # Test 3: Market calendar
         try:
-            from datetime import date
             should_run, reason = hook.should_run_today(date.today())
             result['tests']['market_calendar'] = f'SUCCESS: {reason}'
         except Exception as e:
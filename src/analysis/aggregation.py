@@ -154,6 +154,34 @@ class DataAggregator:
         end_str = end_date.strftime('%Y-%m-%d')
         daily_snapshots = self.db.get_symbol_data(symbol, start_str, end_str)
         
+        return self._build_rolling_metrics(symbol, date, window_days, daily_snapshots)
+    
+    def calculate_rolling_metrics_multi(self, symbol: str, date: datetime,
+                                        windows: Tuple[int, ...] = (30, 60, 90)) -> Dict[int, Optional[RollingMetrics]]:
+        """Calculate rolling metrics for several windows from a single data pull
+        
+        The snapshots for the widest window are fetched once and each narrower
+        window is sliced from them in memory.
+        """
+        if not windows:
+            return {}
+        
+        end_str = date.strftime('%Y-%m-%d')
+        widest_start = (date - timedelta(days=max(windows))).strftime('%Y-%m-%d')
+        daily_snapshots = self.db.get_symbol_data(symbol, widest_start, end_str)
+        daily_snapshots.sort(key=lambda x: x.date)
+        
+        results = {}
+        for window_days in windows:
+            start_str = (date - timedelta(days=window_days)).strftime('%Y-%m-%d')
+            window_snapshots = [s for s in daily_snapshots if s.date >= start_str]
+            results[window_days] = self._build_rolling_metrics(symbol, date, window_days, window_snapshots)
+        
+        return results
+    
+    def _build_rolling_metrics(self, symbol: str, date: datetime, window_days: int,
+                               daily_snapshots: List[DailySnapshot]) -> Optional[RollingMetrics]:
+        """Calculate rolling window metrics from the snapshots covering the window"""
         if len(daily_snapshots) < 2:
             return None
         
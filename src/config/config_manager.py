@@ -3,8 +3,10 @@ Configuration management for the stock analysis system
 """
 import os
 import json
+import stat
+import tempfile
 import yaml
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
@@ -115,13 +117,30 @@ class ConfigManager:
         
         config_dict = asdict(config)
         
+        # Write to a temp file in the same directory and swap it in, so a
+        # crash mid-write never leaves a truncated config behind
+        tmp_path = None
         try:
-            with open(self.config_file, 'w') as f:
+            fd, tmp_path = tempfile.mkstemp(dir=self.config_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
                 yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file owner-only; keep the config's existing mode
+            # so the web app and scheduler can still read it
+            if self.config_file.exists():
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(self.config_file).st_mode))
+            else:
+                os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.config_file)
+            # The saved object is now the current config; keep serving it from memory
+            self._config = config
             print(f"Configuration saved to {self.config_file}")
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return False
     
     def get_default_config(self) -> SystemConfig:
@@ -221,11 +240,12 @@ class ConfigManager:
             log_file=data.get('log_file')
         )
     
-    def clear_symbols(self):
+    def clear_symbols(self, save: bool = True):
         """Remove all symbols from configuration"""
         config = self.get_config()
         config.symbols = []
-        self.save_config(config)
+        if save:
+            self.save_config(config)
         print("Cleared all symbols from configuration")
         return True
 
@@ -250,6 +270,42 @@ class ConfigManager:
         print(f"Added symbol {symbol}")
         return True
     
+    def add_symbols(self, symbols: List[Tuple[str, Optional[str], int]],
+                    save: bool = True) -> int:
+        """Add several symbols to track with a single config save
+        
+        Args:
+            symbols: (symbol, sector, priority) tuples
+            save: Persist the config afterwards; pass False to batch with
+                other in-memory edits and call save_config() once
+        
+        Returns:
+            Number of symbols added
+        """
+        config = self.get_config()
+        existing = {s.symbol for s in config.symbols}
+        added = 0
+        
+        for symbol, sector, priority in symbols:
+            if symbol in existing:
+                print(f"Symbol {symbol} already exists")
+                continue
+            
+            config.symbols.append(SymbolConfig(
+                symbol=symbol,
+                enabled=True,
+                sector=sector,
+                priority=priority
+            ))
+            existing.add(symbol)
+            added += 1
+        
+        if added:
+            if save:
+                self.save_config(config)
+            print(f"Added {added} symbols")
+        return added
+    
     def remove_symbol(self, symbol: str):
         """Remove a symbol from tracking"""
         config = self.get_config()
@@ -1,20 +1,37 @@
+from __future__ import annotations
+
 import argparse
+import functools
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from itertools import repeat
 import json
 import os
-from market_data.market_data import MarketData, FundamentalsError
+import numpy as np
 from market_data.market_data_storage import MarketDataStorage, CacheWriteError
 from strategies.strategy import Strategy
+from strategies.moving_average import MovingAverageStrategy
+from strategies.volume_price import VolumePriceStrategy
+from strategies.macd import MACDStrategy
+from strategies.trend import TrendFollowingStrategy
+from strategies.bollinger import BollingerBandsStrategy
+from strategies.ensemble import EnsembleStrategy
 from market_data.data_types import BacktestResult, TradeMetrics, Trade
 import sys
-from tabulate import tabulate
-from market_data.market_data import MarketData
-from typing import Dict, List
-from recommendations.recommendation_engine import RecommendationEngine
+from typing import Dict, List, Tuple, TYPE_CHECKING
 from utils.results_manager import ResultsManager
 
+# yfinance/pandas (via MarketData and RecommendationEngine) and tabulate are
+# imported where they are used, so --help and early error paths start fast
+if TYPE_CHECKING:
+    from market_data.market_data import MarketData
+    from recommendations.recommendation_engine import RecommendationEngine
+
 DEFAULT_SYMBOLS_FILE = "src/data/default_symbols.json"
 
+logger = logging.getLogger(__name__)
+
 def ensure_data_dir():
     """Ensure the data directory exists and create default symbols file if needed"""
     os.makedirs(os.path.dirname(DEFAULT_SYMBOLS_FILE), exist_ok=True)
@@ -52,49 +69,47 @@ def parse_args():
     parser.add_argument('--grouped', action='store_true', help='Group results by symbol instead of strategy')
     parser.add_argument('--recommendations', action='store_true', help='Get latest trading recommendations')
     parser.add_argument('--keep-all-results', action='store_true', help='Keep all results, do not archive old ones')
+    parser.add_argument('--fp32', action='store_true', help='Use float32 price arrays for indicator math (less memory, lower precision)')
     return parser.parse_args()
 
-def debug_print(msg: str, debug: bool = False):
-    """Print debug messages if debug mode is enabled"""
-    if debug:
-        print(f"DEBUG: {msg}")
-
-def get_market_data(symbol: str, start_date: str, end_date: str, storage: MarketDataStorage, force: bool = False, debug: bool = False):
+def get_market_data(symbol: str, start_date: str, end_date: str, storage: MarketDataStorage, force: bool = False):
     """Get market data, checking cache first"""
-    debug_print(f"Getting market data for {symbol} from {start_date} to {end_date}", debug)
+    logger.debug("Getting market data for %s from %s to %s", symbol, start_date, end_date)
     
     if not force:
-        debug_print("Checking cache for market data", debug)
+        logger.debug("Checking cache for market data")
         data = storage.get_historical_data(symbol, start_date, end_date)
         if data is not None:
-            debug_print("Found cached market data", debug)
+            logger.debug("Found cached market data")
             print("Retrieved market data from cache")
             return data
     
-    debug_print("Fetching market data from source", debug)
+    logger.debug("Fetching market data from source")
+    from market_data.market_data import MarketData
     data = MarketData.get_historical_data(symbol, start_date, end_date)
-    debug_print(f"Fetched market data with {len(data.data_points)} data points", debug)
+    logger.debug("Fetched market data with %d data points", len(data.data_points))
     
-    debug_print("Saving market data to cache", debug)
+    logger.debug("Saving market data to cache")
     storage.save_historical_data(symbol, data)
-    debug_print("Successfully saved to cache", debug)
+    logger.debug("Successfully saved to cache")
     
     print("Retrieved market data from source")
     return data
 
-def get_fundamentals(symbol: str, storage: MarketDataStorage, force: bool = False, debug: bool = False):
+def get_fundamentals(symbol: str, storage: MarketDataStorage, force: bool = False):
     """Get fundamental data, checking cache first"""
-    debug_print(f"Getting fundamental data for {symbol}", debug)
+    logger.debug("Getting fundamental data for %s", symbol)
     
     if not force:
-        debug_print("Checking cache for fundamental data", debug)
+        logger.debug("Checking cache for fundamental data")
         data = storage.get_fundamentals(symbol)
         if data is not None:
-            debug_print(f"Found cached fundamental data", debug)
+            logger.debug("Found cached fundamental data")
             print("Retrieved fundamental data from cache")
             return data
     
-    debug_print("Fetching fundamental data from market", debug)
+    logger.debug("Fetching fundamental data from market")
+    from market_data.market_data import MarketData
     data = MarketData.get_fundamentals(symbol)
     
     if data.failed_attributes:
@@ -102,24 +117,21 @@ def get_fundamentals(symbol: str, storage: MarketDataStorage, force: bool = Fals
         for failure in data.failed_attributes:
             print(f"- {failure}")
     
-    debug_print(f"Fetched fundamental data", debug)
+    logger.debug("Fetched fundamental data")
     
-    debug_print("Saving fundamental data to cache", debug)
+    logger.debug("Saving fundamental data to cache")
     storage.save_fundamentals(symbol, data)
-    debug_print("Successfully saved fundamentals to cache", debug)
+    logger.debug("Successfully saved fundamentals to cache")
     
     print("Retrieved fundamental data from market")
     return data
 
 def load_strategies() -> list[Strategy]:
-    """Load available strategy implementations"""
-    from strategies.moving_average import MovingAverageStrategy
-    from strategies.volume_price import VolumePriceStrategy
-    from strategies.macd import MACDStrategy
-    from strategies.trend import TrendFollowingStrategy
-    from strategies.bollinger import BollingerBandsStrategy
-    from strategies.ensemble import EnsembleStrategy
+    """Load available strategy implementations
     
+    Returns fresh instances on every call: strategies accumulate per-symbol
+    state through add_data, so they must not be shared between runs.
+    """
     base_strategies = [
         MovingAverageStrategy(),
         VolumePriceStrategy(),
@@ -131,8 +143,17 @@ def load_strategies() -> list[Strategy]:
     # Add ensemble strategy that combines all others
     return base_strategies + [EnsembleStrategy(base_strategies)]
 
+# Column formats for the backtest tables: counts as integers, returns as percentages
+BACKTEST_FLOATFMT = ("", ".0f", ".2%", ".2%", ".0f", ".2%", ".2%")
+
+# Bound formatters for the analysis/recommendation cells, parsed once instead of per row
+_format_pct = "{:.1%}".format
+_format_price = "${:.2f}".format
+_format_ratio = "{:.1f}".format
+
 def format_backtest_table(summaries: Dict[str, Dict], strategy_name: str) -> str:
     """Format backtest results as a table, grouped by strategy"""
+    from tabulate import tabulate
     headers = [
         "Symbol",
         "Signals", 
@@ -148,17 +169,19 @@ def format_backtest_table(summaries: Dict[str, Dict], strategy_name: str) -> str
         rows.append([
             symbol,
             summary['total_trades'],
-            f"{sr['total_return']:.2%}",
-            f"{sr['annualized_return']:.2%}",
+            sr['total_return'],
+            sr['annualized_return'],
             sr['total_trades_executed'],
-            f"{bh['total_return']:.2%}",
-            f"{bh['annualized_return']:.2%}"
+            bh['total_return'],
+            bh['annualized_return']
         ])
     
-    return f"\n{strategy_name} Results:\n" + tabulate(rows, headers=headers, tablefmt="grid")
+    return f"\n{strategy_name} Results:\n" + tabulate(rows, headers=headers, tablefmt="grid",
+                                                      floatfmt=BACKTEST_FLOATFMT)
 
 def format_grouped_table(all_results: Dict[str, Dict[str, Dict]], symbol: str) -> str:
     """Format backtest results as a table, grouped by symbol"""
+    from tabulate import tabulate
     headers = [
         "Strategy",
         "Signals", 
@@ -168,56 +191,66 @@ def format_grouped_table(all_results: Dict[str, Dict[str, Dict]], symbol: str) -
     
     rows = []
     # Find first strategy that has data for this symbol
-    bh = None
-    for strategy_results in all_results.values():
-        if symbol in strategy_results:
-            bh = strategy_results[symbol]['buy_and_hold']
-            break
+    bh = next((strategy_results[symbol]['buy_and_hold']
+               for strategy_results in all_results.values()
+               if symbol in strategy_results), None)
     
     if bh is None:
         return f"\n{symbol} Results:\nNo data available"
     
     for strategy_name, summaries in all_results.items():
-        if symbol not in summaries:
+        summary = summaries.get(symbol)
+        if summary is None:
             # Skip strategies that don't have data for this symbol
             continue
             
-        summary = summaries[symbol]
         sr = summary['strategy_returns']
         
         rows.append([
             strategy_name,
             summary['total_trades'],
-            f"{sr['total_return']:.2%}",
-            f"{sr['annualized_return']:.2%}",
+            sr['total_return'],
+            sr['annualized_return'],
             sr['total_trades_executed'],
-            f"{bh['total_return']:.2%}",
-            f"{bh['annualized_return']:.2%}"
+            bh['total_return'],
+            bh['annualized_return']
         ])
     
     if not rows:
         return f"\n{symbol} Results:\nNo strategy results available"
     
-    return f"\n{symbol} Results:\n" + tabulate(rows, headers=headers, tablefmt="grid")
+    return f"\n{symbol} Results:\n" + tabulate(rows, headers=headers, tablefmt="grid",
+                                               floatfmt=BACKTEST_FLOATFMT)
+
+@functools.lru_cache(maxsize=8)
+def _load_symbols_cached(source_file: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Parse a symbols file; cached per (path, mtime) so edits are picked up"""
+    with open(source_file, 'rb') as f:
+        raw = f.read()
+        
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        raise ValueError(f"Invalid JSON in symbols file: {source_file}")
+    if not isinstance(data, list):
+        raise ValueError("Symbols file must contain a list of symbols")
+    return tuple(data)
 
 def load_symbols(source_file: str) -> List[str]:
     """Load symbols from JSON file"""
     ensure_data_dir()
     
-    if not os.path.exists(source_file):
+    try:
+        mtime_ns = os.stat(source_file).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Symbols file not found: {source_file}")
-        
-    with open(source_file, 'r') as f:
-        try:
-            data = json.load(f)
-            if not isinstance(data, list):
-                raise ValueError("Symbols file must contain a list of symbols")
-            return data
-        except json.JSONDecodeError:
-            raise ValueError(f"Invalid JSON in symbols file: {source_file}")
+    
+    # Return a fresh list so callers can't modify the cached copy
+    return list(_load_symbols_cached(source_file, mtime_ns))
 
 def format_analysis_table(results: Dict[str, Dict], strategy_name: str) -> str:
     """Format analysis results as a table, grouped by strategy"""
+    from tabulate import tabulate
     headers = [
         "Symbol",
         "Signal",
@@ -225,19 +258,16 @@ def format_analysis_table(results: Dict[str, Dict], strategy_name: str) -> str:
         "Details"
     ]
     
-    rows = []
-    for symbol, analysis in results.items():
-        rows.append([
-            symbol,
-            analysis['signal'],
-            f"{analysis['confidence']:.1%}",
-            analysis['details']
-        ])
+    rows = [
+        [symbol, analysis['signal'], _format_pct(analysis['confidence']), analysis['details']]
+        for symbol, analysis in results.items()
+    ]
     
     return f"\n{strategy_name} Analysis:\n" + tabulate(rows, headers=headers, tablefmt="grid")
 
 def format_grouped_analysis_table(all_results: Dict[str, Dict[str, Dict]], symbol: str) -> str:
     """Format analysis results as a table, grouped by symbol"""
+    from tabulate import tabulate
     headers = [
         "Strategy",
         "Signal",
@@ -247,14 +277,14 @@ def format_grouped_analysis_table(all_results: Dict[str, Dict[str, Dict]], symbo
     
     rows = []
     for strategy_name, results in all_results.items():
-        if symbol not in results:
+        analysis = results.get(symbol)
+        if analysis is None:
             continue
             
-        analysis = results[symbol]
         rows.append([
             strategy_name,
             analysis['signal'],
-            f"{analysis['confidence']:.1%}",
+            _format_pct(analysis['confidence']),
             analysis['details']
         ])
     
@@ -265,6 +295,7 @@ def format_grouped_analysis_table(all_results: Dict[str, Dict[str, Dict]], symbo
 
 def format_recommendations_table(recommendations: Dict[str, Dict]) -> str:
     """Format recommendations as a table"""
+    from tabulate import tabulate
     headers = [
         "Symbol",
         "Action",
@@ -278,38 +309,50 @@ def format_recommendations_table(recommendations: Dict[str, Dict]) -> str:
         "Risk/Reward"
     ]
     
-    rows = []
-    for symbol, rec in recommendations.items():
-        rows.append([
+    rows = [
+        [
             symbol,
             rec['action'],
             rec['type'],
-            f"{rec['confidence']:.1%}",
-            f"${rec['entry_price']:.2f}",
-            f"${rec['stop_loss']:.2f}",
-            f"${rec['take_profit']:.2f}",
+            _format_pct(rec['confidence']),
+            _format_price(rec['entry_price']),
+            _format_price(rec['stop_loss']),
+            _format_price(rec['take_profit']),
             rec['position_size'],
             rec['order_type'],
-            f"{rec['risk_reward']:.1f}"
-        ])
+            _format_ratio(rec['risk_reward'])
+        ]
+        for symbol, rec in recommendations.items()
+    ]
     
     return "\nTrading Recommendations:\n" + tabulate(rows, headers=headers, tablefmt="grid")
 
 def convert_backtest_result(result: BacktestResult) -> Dict:
-    """Convert BacktestResult object to dictionary format"""
+    """Convert BacktestResult object to dictionary format
+    
+    strategy_returns is passed through as-is; TradeMetrics supports the
+    same dict-style access as the copied dict it replaces.
+    """
     return {
-        'strategy_returns': {
-            'total_return': result.strategy_returns.total_return,
-            'annualized_return': result.strategy_returns.annualized_return,
-            'total_trades_executed': result.strategy_returns.total_trades_executed,
-            'avg_return_per_trade': result.strategy_returns.avg_return_per_trade
-        },
+        'strategy_returns': result.strategy_returns,
         'buy_and_hold': result.buy_and_hold,
         'total_trades': result.total_trades
     }
 
+def run_strategy(strategy: Strategy, run_analysis: bool, run_backtest: bool,
+                 start_date: datetime, end_date: datetime):
+    """Run one strategy's analysis and/or backtest; executed in a worker process
+    
+    Returns:
+        (analysis results or None, raw backtest results or None)
+    """
+    analysis = strategy.analyze() if run_analysis else None
+    raw_results = strategy.backtest(start_date=start_date, end_date=end_date) if run_backtest else None
+    return analysis, raw_results
+
 def process_group(group_name: str, symbols_data: Dict[str, Dict], args: argparse.Namespace, 
-                 market: MarketData, strategies: List[Strategy], engine: RecommendationEngine):
+                 market: MarketData, strategies: List[Strategy], engine: RecommendationEngine,
+                 start_date: datetime, end_date: datetime):
     """Process a group of symbols"""
     print(f"\nProcessing {group_name} ({len(symbols_data)} symbols):")
     
@@ -328,25 +371,105 @@ def process_group(group_name: str, symbols_data: Dict[str, Dict], args: argparse
         "strategies": {}
     } for symbol in symbols_data.keys()}
     
-    # Run each strategy
-    for strategy in strategies:
-        if args.verbose:
+    # Hand each symbol's data to every strategy once, before any of them run
+    for symbol, data in symbols_data.items():
+        historical = data['historical']
+        fundamental = data.get('fundamental')
+        for strategy in strategies:
+            strategy.add_data(symbol, historical, fundamental)
+    
+    # Strategies are independent, so run them in parallel worker processes
+    if args.verbose:
+        for strategy in strategies:
             print(f"\nRunning {strategy.name}...")
-        
-        # Add data to strategy
-        for symbol, data in symbols_data.items():
-            strategy.add_data(symbol, data['historical'], data.get('fundamental'))
-        
-        # Run analysis if requested
-        if args.analyze or args.recommendations:
-            analysis_results[strategy.name] = strategy.analyze()
+    
+    # Reuse cached backtests for strategies already run on this range and data
+    storage = MarketDataStorage(args.cache_dir)
+    cached_backtests = {}
+    if args.backtest and not args.force:
+        for strategy in strategies:
+            cached = {}
+            parameters = strategy.parameters()
+            for symbol, data in symbols_data.items():
+                result = storage.get_backtest(symbol, strategy.name, start_date, end_date,
+                                              data['historical'], parameters)
+                if result is None:
+                    break
+                cached[symbol] = result
+            else:
+                cached_backtests[strategy.name] = cached
+    
+    run_analysis = args.analyze or args.recommendations
+    run_backtests = [args.backtest and strategy.name not in cached_backtests for strategy in strategies]
+    cpu_count = os.cpu_count() or 1
+    
+    # Split independent strategies into symbol shards so the pool can use more
+    # cores than there are strategies; each task is (strategy index, strategy, run backtest)
+    shards_per_strategy = max(1, -(-cpu_count // max(1, len(strategies))))
+    # An ensemble only combines its children's results; when the children run here
+    # anyway, combine their results afterwards instead of running them a second time
+    fused = [isinstance(strategy, EnsembleStrategy) and all(child in strategies for child in strategy.strategies)
+             for strategy in strategies]
+    tasks = []
+    for index, (strategy, run_backtest) in enumerate(zip(strategies, run_backtests)):
+        # Fused ensembles are combined below; strategies with cached backtests and
+        # no analysis to run have nothing to do in a worker
+        if fused[index] or not (run_analysis or run_backtest):
+            continue
+        symbols = strategy.symbols
+        if strategy.symbols_independent and min(len(symbols), shards_per_strategy) > 1:
+            shard_size = -(-len(symbols) // shards_per_strategy)
+            for start in range(0, len(symbols), shard_size):
+                tasks.append((index, strategy.for_symbols(symbols[start:start + shard_size]), run_backtest))
+        else:
+            tasks.append((index, strategy, run_backtest))
+    
+    strategy_runs = [({} if run_analysis else None, {} if run_backtest else None)
+                     for run_backtest in run_backtests]
+    if tasks:
+        max_workers = max(1, min(len(tasks), cpu_count))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            task_runs = executor.map(
+                run_strategy, [task[1] for task in tasks],
+                repeat(run_analysis), [task[2] for task in tasks], repeat(start_date), repeat(end_date)
+            )
             
-        # Run backtest if requested
+            # Merge shard results back per strategy; shards are in symbol order
+            for (index, _, _), (analysis, raw_results) in zip(tasks, task_runs):
+                if analysis is not None:
+                    strategy_runs[index][0].update(analysis)
+                if raw_results is not None:
+                    strategy_runs[index][1].update(raw_results)
+    
+    for index, strategy in enumerate(strategies):
+        if not fused[index]:
+            continue
+        analysis, raw_results = strategy_runs[index]
+        children = [strategies.index(child) for child in strategy.strategies]
+        if analysis is not None:
+            analysis.update(strategy.combine_analyses(
+                {strategies[i].name: strategy_runs[i][0] for i in children}))
+        if raw_results is not None:
+            raw_results.update(strategy.combine_backtests(
+                {strategies[i].name: strategy_runs[i][1] if run_backtests[i] else cached_backtests[strategies[i].name]
+                 for i in children},
+                start_date, end_date))
+    
+    # Collect each strategy's results in their original order
+    for strategy, ran_backtest, (analysis, raw_results) in zip(strategies, run_backtests, strategy_runs):
+        # Store analysis if requested
+        if run_analysis:
+            analysis_results[strategy.name] = analysis
+            
+        # Process backtest if requested
         if args.backtest:
-            raw_results = strategy.backtest(
-                start_date=datetime.strptime(args.start, '%Y-%m-%d'),
-                end_date=datetime.strptime(args.end, '%Y-%m-%d')
-            )
+            if ran_backtest:
+                parameters = strategy.parameters()
+                for symbol, result in raw_results.items():
+                    storage.save_backtest(symbol, strategy.name, start_date, end_date,
+                                          symbols_data[symbol]['historical'], result, parameters)
+            else:
+                raw_results = cached_backtests[strategy.name]
             
             # Convert BacktestResult objects to dictionaries for display
             backtest_results[strategy.name] = {
@@ -391,63 +514,78 @@ def process_group(group_name: str, symbols_data: Dict[str, Dict], args: argparse
                     "trades": trades_list
                 }
     
-    # Display and save backtest results if requested
-    if args.backtest:
-        # Display results
-        if args.grouped:
-            for symbol in symbols_data.keys():
-                print(format_grouped_table(backtest_results, symbol))
-        else:
-            for strategy_name, results in backtest_results.items():
-                print(format_backtest_table(results, strategy_name))
-        
-        # Save results
-        for symbol, results in combined_results.items():
-            today = datetime.now().strftime('%Y%m%d')
-            filename = f"{symbol}_backtest_{today}.json"
-            filepath = os.path.join("results", filename)
+    # Collect display output and write it in one go at the end
+    out = []
+    today = datetime.now().strftime('%Y%m%d')
+    try:
+        # Display and save backtest results if requested
+        if args.backtest:
+            # Display results
+            if args.grouped:
+                for symbol in symbols_data.keys():
+                    out.append(format_grouped_table(backtest_results, symbol))
+            else:
+                for strategy_name, results in backtest_results.items():
+                    out.append(format_backtest_table(results, strategy_name))
             
-            with open(filepath, 'w') as f:
-                json.dump(results, f, indent=2)
-            print(f"\nBacktest results saved to: {filepath}")
-    
-    # Display and save recommendations if requested
-    if args.recommendations:
-        recommendations = engine.generate_recommendations(
-            symbols_data.keys(),
-            analysis_results,
-            backtest_results
-        )
-        
-        # Display recommendations
-        print(format_recommendations_table(recommendations))
+            # Save results
+            for symbol, results in combined_results.items():
+                filename = f"{symbol}_backtest_{today}.json"
+                filepath = os.path.join("results", filename)
+                
+                with open(filepath, 'w') as f:
+                    json.dump(results, f, indent=2)
+                out.append(f"\nBacktest results saved to: {filepath}")
         
-        # Save recommendations
-        for symbol, rec in recommendations.items():
-            today = datetime.now().strftime('%Y%m%d')
-            filename = f"{symbol}_recommendations_{today}.json"
-            filepath = os.path.join("results", filename)
+        # Display and save recommendations if requested
+        if args.recommendations:
+            recommendations = engine.generate_recommendations(
+                symbols_data.keys(),
+                analysis_results,
+                backtest_results
+            )
             
-            with open(filepath, 'w') as f:
-                json.dump({
-                    "symbol": symbol,
-                    "date_run": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    "recommendations": rec
-                }, f, indent=2)
-            print(f"\nRecommendations saved to: {filepath}")
-    
-    # Display analysis results if requested
-    if args.analyze:
-        if args.grouped:
-            for symbol in symbols_data.keys():
-                print(format_grouped_analysis_table(analysis_results, symbol))
-        else:
-            for strategy_name, results in analysis_results.items():
-                print(format_analysis_table(results, strategy_name))
+            # Display recommendations
+            out.append(format_recommendations_table(recommendations))
+            
+            # Save recommendations
+            for symbol, rec in recommendations.items():
+                filename = f"{symbol}_recommendations_{today}.json"
+                filepath = os.path.join("results", filename)
+                
+                with open(filepath, 'w') as f:
+                    # default=float covers NumPy scalars (e.g. float32 prices under --fp32)
+                    json.dump({
+                        "symbol": symbol,
+                        "date_run": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                        "recommendations": rec
+                    }, f, indent=2, default=float)
+                out.append(f"\nRecommendations saved to: {filepath}")
+        
+        # Display analysis results if requested
+        if args.analyze:
+            if args.grouped:
+                for symbol in symbols_data.keys():
+                    out.append(format_grouped_analysis_table(analysis_results, symbol))
+            else:
+                for strategy_name, results in analysis_results.items():
+                    out.append(format_analysis_table(results, strategy_name))
+    finally:
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+            sys.stdout.flush()
 
 def main():
     args = parse_args()
-    debug = args.debug
+    
+    # Debug messages are formatted only when --debug enables them
+    logging.basicConfig(format="%(levelname)s: %(message)s")
+    if args.debug:
+        logger.setLevel(logging.DEBUG)
+    
+    # Parse the date range once; it is reused for every fetch and backtest
+    start_date = datetime.strptime(args.start, '%Y-%m-%d')
+    end_date = datetime.strptime(args.end, '%Y-%m-%d')
     
     # Ensure results directory exists
     results_dir = "results"
@@ -463,10 +601,14 @@ def main():
             print(f"Error loading symbols: {str(e)}")
             return 1
     
+    # Normalize and intern once; every results dict downstream is keyed by these strings
+    symbols = [sys.intern(symbol.upper()) for symbol in symbols]
+    
     if args.verbose:
         print(f"\nProcessing {len(symbols)} symbol(s)...")
     
     # Initialize market data with cache directory
+    from market_data.market_data import MarketData
     market = MarketData(cache_dir=args.cache_dir)
     
     # Load market data in batches
@@ -474,22 +616,32 @@ def main():
     try:
         batch_data = market.get_batch_data(
             symbols=symbols,
-            start_date=datetime.strptime(args.start, '%Y-%m-%d'),
-            end_date=datetime.strptime(args.end, '%Y-%m-%d'),
+            start_date=start_date,
+            end_date=end_date,
             force_refresh=args.force
         )
         
+        # Fundamentals are one network round trip per symbol, so fetch them concurrently
+        fundamentals = {}
+        if args.fundamentals and batch_data:
+            with ThreadPoolExecutor(max_workers=min(32, len(batch_data))) as executor:
+                futures = {
+                    executor.submit(market._get_fundamental_data, symbol, args.force): symbol
+                    for symbol in batch_data
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        fundamentals[symbol] = future.result()
+                    except Exception as e:
+                        print(f"Warning: Could not fetch fundamentals for {symbol}: {e}")
+        
         for symbol, historical in batch_data.items():
-            fundamental = None
-            if args.fundamentals:
-                try:
-                    fundamental = market._get_fundamental_data(symbol, args.force)
-                except Exception as e:
-                    print(f"Warning: Could not fetch fundamentals for {symbol}: {e}")
-            
+            if args.fp32:
+                historical.column_dtype = np.float32
             symbols_data[symbol] = {
                 'historical': historical,
-                'fundamental': fundamental
+                'fundamental': fundamentals.get(symbol)
             }
     except Exception as e:
         print(f"Error fetching market data: {e}")
@@ -504,10 +656,12 @@ def main():
     # Initialize recommendation engine if needed
     engine = None
     if args.analyze and args.backtest or args.recommendations:
+        from recommendations.recommendation_engine import RecommendationEngine
         engine = RecommendationEngine()
     
     # Process the group
-    process_group("All Symbols", symbols_data, args, market, strategies, engine)
+    process_group("All Symbols", symbols_data, args, market, strategies, engine,
+                  start_date, end_date)
     
     return 0
 
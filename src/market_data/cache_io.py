@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    """Write data to path via a temp file and os.replace
+    
+    Readers see either the old file or the complete new one, never a partial
+    write, so a crash mid-write can't corrupt a good cache file. No fsync:
+    the cache can always be re-fetched, only torn files need ruling out.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
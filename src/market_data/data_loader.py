@@ -3,7 +3,8 @@ from datetime import datetime
 import os
 import json
 import yfinance as yf
-from .data_types import HistoricalData, FundamentalData, DataPoint
+from .cache_io import atomic_write_bytes
+from .data_types import HistoricalData, FundamentalData
 
 @dataclass
 class MarketDataConfig:
@@ -32,17 +33,24 @@ def get_market_data(symbol: str, start_date: str, end_date: str,
     fundamental_data = None
     
     # Try to load from cache first
-    if not force_refresh and os.path.exists(historical_cache):
-        if debug:
-            print(f"Loading {symbol} historical data from cache...")
-        with open(historical_cache, 'r') as f:
-            historical_data = HistoricalData.from_dict(json.load(f))
+    # Open directly and treat a missing file as a cache miss; no separate exists() stat
+    if not force_refresh:
+        try:
+            with open(historical_cache, 'rb') as f:
+                if debug:
+                    print(f"Loading {symbol} historical data from cache...")
+                historical_data = HistoricalData.from_dict(json.loads(f.read()))
+        except FileNotFoundError:
+            pass
     
-    if not force_refresh and fundamentals and os.path.exists(fundamental_cache):
-        if debug:
-            print(f"Loading {symbol} fundamental data from cache...")
-        with open(fundamental_cache, 'r') as f:
-            fundamental_data = FundamentalData.from_dict(json.load(f))
+    if not force_refresh and fundamentals:
+        try:
+            with open(fundamental_cache, 'rb') as f:
+                if debug:
+                    print(f"Loading {symbol} fundamental data from cache...")
+                fundamental_data = FundamentalData.from_dict(json.loads(f.read()))
+        except FileNotFoundError:
+            pass
     
     # Fetch from yfinance if needed
     if historical_data is None or force_refresh:
@@ -50,25 +58,15 @@ def get_market_data(symbol: str, start_date: str, end_date: str,
             print(f"Fetching {symbol} historical data from yfinance...")
         
         ticker = yf.Ticker(symbol)
-        history = ticker.history(start=start_date, end=end_date)
+        # actions=False skips the dividends/splits columns, which are never used
+        history = ticker.history(start=start_date, end=end_date, actions=False)
         
         # Convert to our data structure
-        data_points = []
-        for index, row in history.iterrows():
-            data_points.append(DataPoint(
-                date=index.strftime('%Y-%m-%d'),
-                open=float(row['Open']),
-                high=float(row['High']),
-                low=float(row['Low']),
-                close=float(row['Close']),
-                volume=int(row['Volume'])
-            ))
-        
-        historical_data = HistoricalData(symbol=symbol, data_points=data_points)
+        historical_data = HistoricalData.from_frame(symbol, history)
         
         # Cache the data
-        with open(historical_cache, 'w') as f:
-            json.dump(historical_data.to_dict(), f)
+        atomic_write_bytes(historical_cache,
+                           json.dumps(historical_data.to_dict(), separators=(',', ':')).encode())
     
     if (fundamental_data is None or force_refresh) and fundamentals:
         if debug:
@@ -89,7 +87,6 @@ def get_market_data(symbol: str, start_date: str, end_date: str,
         )
         
         # Cache the data
-        with open(fundamental_cache, 'w') as f:
-            json.dump(fundamental_data.to_dict(), f)
+        atomic_write_bytes(fundamental_cache, json.dumps(fundamental_data.to_dict()).encode())
     
     return historical_data, fundamental_data 
\ No newline at end of file
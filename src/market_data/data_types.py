@@ -1,8 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+import numpy as np
 
-@dataclass
+@dataclass(slots=True)
 class DataPoint:
     date: str
     open: float
@@ -29,6 +30,50 @@ class DataPoint:
 class HistoricalData:
     symbol: str
     data_points: List[DataPoint]
+    # dtype for column() arrays; float32 halves their memory at reduced precision
+    column_dtype: Any = field(default=np.float64, repr=False, compare=False)
+    _columns: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def column(self, name: str) -> np.ndarray:
+        """Get one field of every data point as an array (e.g. column('close'))
+        
+        Built once per field and shared by every strategy holding this object;
+        rebuilt if data points have been added or column_dtype has changed since.
+        """
+        values = self._columns.get(name)
+        if (values is None or len(values) != len(self.data_points)
+                or values.dtype != self.column_dtype):
+            values = np.fromiter((getattr(p, name) for p in self.data_points),
+                                 dtype=self.column_dtype, count=len(self.data_points))
+            self._columns[name] = values
+        return values
+    
+    # Columnar (structure-of-arrays) views over data_points, e.g. historical.close
+    @property
+    def open(self) -> np.ndarray:
+        return self.column('open')
+    
+    @property
+    def high(self) -> np.ndarray:
+        return self.column('high')
+    
+    @property
+    def low(self) -> np.ndarray:
+        return self.column('low')
+    
+    @property
+    def close(self) -> np.ndarray:
+        return self.column('close')
+    
+    @property
+    def volume(self) -> np.ndarray:
+        return self.column('volume')
+    
+    def __len__(self) -> int:
+        return len(self.data_points)
+    
+    def __getitem__(self, index):
+        return self.data_points[index]
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -38,9 +83,24 @@ class HistoricalData:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'HistoricalData':
+        # Positional construction inline; this is the cache-load hot path (hundreds of points per symbol)
         return cls(
             symbol=data['symbol'],
-            data_points=[DataPoint.from_dict(dp) for dp in data['data_points']]
+            data_points=[
+                DataPoint(dp['date'], dp['open'], dp['high'], dp['low'], dp['close'], dp['volume'])
+                for dp in data['data_points']
+            ]
+        )
+    
+    @classmethod
+    def from_frame(cls, symbol: str, frame) -> 'HistoricalData':
+        """Build from a yfinance OHLCV DataFrame using columnar access instead of iterrows()"""
+        dates = frame.index.strftime('%Y-%m-%d').tolist()
+        ohlc = frame[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float64).tolist()
+        volumes = frame['Volume'].to_numpy(dtype=np.int64).ravel().tolist()
+        return cls(
+            symbol=symbol,
+            data_points=[DataPoint(d, o, h, l, c, v) for d, (o, h, l, c), v in zip(dates, ohlc, volumes)]
         )
 
 @dataclass
@@ -61,7 +121,7 @@ class CompanyInfo:
     beta: Optional[float] = None
     dividend_yield: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True)
 class FundamentalData:
     symbol: str
     market_cap: float = 0
@@ -86,28 +146,18 @@ class FundamentalData:
     def from_dict(cls, data: Dict[str, Any]) -> 'FundamentalData':
         return cls(**data)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary format"""
-        result = {
-            'symbol': self.symbol,
-            'market_cap': self.market_cap,
-            'pe_ratio': self.pe_ratio,
-            'dividend_yield': self.dividend_yield,
-            'beta': self.beta,
-            'sector': self.sector,
-            'industry': self.industry
-        }
-        
-        return result 
-
-@dataclass 
+@dataclass(slots=True)
 class TradeMetrics:
     total_return: float
     annualized_return: float
     total_trades_executed: int
     avg_return_per_trade: float
+    
+    def __getitem__(self, key: str):
+        """Allow dict-style access (metrics['total_return']) used by the result tables"""
+        return getattr(self, key)
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     entry_date: datetime
     entry_price: float
@@ -117,13 +167,55 @@ class Trade:
     pnl: float
     return_pct: float
     size: int = 100
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'entry_date': self.entry_date.isoformat() if self.entry_date else None,
+            'entry_price': self.entry_price,
+            'exit_date': self.exit_date.isoformat() if self.exit_date else None,
+            'exit_price': self.exit_price,
+            'type': self.type,
+            'pnl': self.pnl,
+            'return_pct': self.return_pct,
+            'size': self.size
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Trade':
+        return cls(
+            entry_date=datetime.fromisoformat(data['entry_date']) if data['entry_date'] else None,
+            entry_price=data['entry_price'],
+            exit_date=datetime.fromisoformat(data['exit_date']) if data['exit_date'] else None,
+            exit_price=data['exit_price'],
+            type=data['type'],
+            pnl=data['pnl'],
+            return_pct=data['return_pct'],
+            size=data['size']
+        )
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     trades: List[Trade]
     strategy_returns: TradeMetrics
     buy_and_hold: Dict[str, float]
     total_trades: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trades': [trade.to_dict() for trade in self.trades],
+            'strategy_returns': asdict(self.strategy_returns),
+            'buy_and_hold': self.buy_and_hold,
+            'total_trades': self.total_trades
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BacktestResult':
+        return cls(
+            trades=[Trade.from_dict(trade) for trade in data['trades']],
+            strategy_returns=TradeMetrics(**data['strategy_returns']),
+            buy_and_hold=data['buy_and_hold'],
+            total_trades=data['total_trades']
+        )
 
 @dataclass 
 class TradingSignal:
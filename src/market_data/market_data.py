@@ -1,4 +1,6 @@
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import io
 import os
 import json
 import yfinance as yf
@@ -6,8 +8,11 @@ from typing import Dict, List, Optional, Tuple
 import time
 from yfinance.exceptions import YFRateLimitError
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
+import numpy as np
 
+from .cache_io import atomic_write_bytes
 from .data_types import (
     DataPoint,
     HistoricalData,
@@ -23,6 +28,7 @@ class MarketData:
         self.cache_dir = cache_dir
         self.results_dir = "results"  # At same level as cache
         self.max_retries = 3
+        self.max_fetch_workers = 8  # Concurrent chart requests; kept low for Yahoo's rate limits
         self.data_cache = {}
         
         # Create both cache and results directories
@@ -35,8 +41,81 @@ class MarketData:
         
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        # Keep-alive pool large enough for the concurrent chart API fetch threads
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         print("Set up Yahoo Finance session")
     
+    def _historical_cache_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f"{symbol}_historical.json")
+
+    def _binary_cache_path(self, symbol: str) -> str:
+        # Versioned so a layout change just leaves old files unread
+        return os.path.join(self.cache_dir, "npz_v1", f"{symbol}.npz")
+
+    def _read_historical_cache(self, symbol: str) -> HistoricalData:
+        """Load cached history, preferring the binary column cache when it is current
+        
+        The JSON file stays the source of truth (the web app and dev tools read
+        it directly); the .npz copy is used only if it is at least as new.
+        """
+        cache_file = self._historical_cache_path(symbol)
+        binary_file = self._binary_cache_path(symbol)
+        try:
+            if os.stat(binary_file).st_mtime_ns >= os.stat(cache_file).st_mtime_ns:
+                with np.load(binary_file) as columns:
+                    data_points = [
+                        DataPoint(d, o, h, l, c, v) for d, o, h, l, c, v in zip(
+                            columns['date'].tolist(), columns['open'].tolist(),
+                            columns['high'].tolist(), columns['low'].tolist(),
+                            columns['close'].tolist(), columns['volume'].tolist()
+                        )
+                    ]
+                return HistoricalData(symbol=symbol, data_points=data_points)
+        except (OSError, KeyError, ValueError):
+            pass
+
+        # Parse from bytes; skips the text-decoding layer of json.load
+        with open(cache_file, 'rb') as f:
+            historical_data = HistoricalData.from_dict(json.loads(f.read()))
+        self._write_binary_cache(symbol, historical_data)
+        return historical_data
+
+    def _try_read_historical_cache(self, symbol: str) -> Optional[HistoricalData]:
+        try:
+            return self._read_historical_cache(symbol)
+        except FileNotFoundError:
+            return None
+
+    def _write_historical_cache(self, symbol: str, historical_data: HistoricalData):
+        # Compact separators: OHLCV caches are number-heavy and default separators add ~10% whitespace
+        atomic_write_bytes(self._historical_cache_path(symbol),
+                           json.dumps(historical_data.to_dict(), separators=(',', ':')).encode())
+        self._write_binary_cache(symbol, historical_data)
+
+    def _write_binary_cache(self, symbol: str, historical_data: HistoricalData):
+        """Write the columns of historical_data as an uncompressed .npz"""
+        points = historical_data.data_points
+        if not points:
+            return
+        binary_file = self._binary_cache_path(symbol)
+        try:
+            os.makedirs(os.path.dirname(binary_file), exist_ok=True)
+            buffer = io.BytesIO()
+            np.savez(
+                buffer,
+                date=np.array([p.date for p in points]),
+                open=np.fromiter((p.open for p in points), dtype=np.float64, count=len(points)),
+                high=np.fromiter((p.high for p in points), dtype=np.float64, count=len(points)),
+                low=np.fromiter((p.low for p in points), dtype=np.float64, count=len(points)),
+                close=np.fromiter((p.close for p in points), dtype=np.float64, count=len(points)),
+                volume=np.fromiter((p.volume for p in points), dtype=np.int64, count=len(points))
+            )
+            atomic_write_bytes(binary_file, buffer.getvalue())
+        except OSError as e:
+            print(f"Warning: could not write binary cache for {symbol}: {str(e)}")
+
     def get_data(self, symbol: str, start_date: datetime, end_date: datetime, 
                  include_fundamentals: bool = False, force_refresh: bool = False) -> Tuple[HistoricalData, Optional[FundamentalData]]:
         """Get market data for a symbol from memory cache first"""
@@ -57,101 +136,137 @@ class MarketData:
     def get_batch_data(self, symbols: List[str], start_date: datetime, end_date: datetime, force_refresh: bool = False) -> Dict[str, HistoricalData]:
         results = {}
         
-        # Process cached data first
+        # Process cached data first; a missing cache file shows up as None rather than a separate exists() check
+        symbols_to_read = [] if force_refresh else [symbol for symbol in symbols if symbol not in self.data_cache]
+        
+        # Read the cache files concurrently so their I/O overlaps instead of running back to back
+        if len(symbols_to_read) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_fetch_workers, len(symbols_to_read))) as executor:
+                loaded = dict(zip(symbols_to_read, executor.map(self._try_read_historical_cache, symbols_to_read)))
+        else:
+            loaded = {symbol: self._try_read_historical_cache(symbol) for symbol in symbols_to_read}
+        
         symbols_to_fetch = []
         for symbol in symbols:
             if symbol in self.data_cache:
                 results[symbol] = self.data_cache[symbol]
-                continue
-                
-            cache_file = os.path.join(self.cache_dir, f"{symbol}_historical.json")
-            if not force_refresh and os.path.exists(cache_file):
-                with open(cache_file, 'r') as f:
-                    data = HistoricalData.from_dict(json.load(f))
-                    results[symbol] = data
-                    self.data_cache[symbol] = data
-                    print(f"Loaded {symbol} from cache")
+            elif loaded.get(symbol) is not None:
+                results[symbol] = self.data_cache[symbol] = loaded[symbol]
+                print(f"Loaded {symbol} from cache")
             else:
                 symbols_to_fetch.append(symbol)
         
         if not symbols_to_fetch:
             return results
 
-        # Process symbols using direct API calls
-        for symbol in symbols_to_fetch:
-            try:
-                print(f"\nFetching data for {symbol}...")
-                period1 = int(start_date.timestamp())
-                period2 = int(end_date.timestamp())
-                
-                url = f'https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?period1={period1}&period2={period2}&interval=1d'
-                response = self.session.get(url)
-                response.raise_for_status()
-                
-                data = response.json()
-                if 'chart' not in data or 'result' not in data['chart'] or not data['chart']['result']:
-                    print(f"Warning: No data returned for {symbol}")
-                    continue
-                    
-                result = data['chart']['result'][0]
-                timestamps = result['timestamp']
-                quote = result['indicators']['quote'][0]
-                
-                data_points = []
-                for i, ts in enumerate(timestamps):
-                    if all(quote[field][i] is not None for field in ['open', 'high', 'low', 'close', 'volume']):
-                        data_points.append(DataPoint(
-                            date=datetime.fromtimestamp(ts).strftime('%Y-%m-%d'),
-                            open=float(quote['open'][i]),
-                            high=float(quote['high'][i]),
-                            low=float(quote['low'][i]),
-                            close=float(quote['close'][i]),
-                            volume=int(quote['volume'][i])
-                        ))
-                
-                if data_points:
-                    historical_data = HistoricalData(symbol=symbol, data_points=data_points)
-                    results[symbol] = historical_data
-                    self.data_cache[symbol] = historical_data
-                    
-                    # Cache to file
-                    cache_file = os.path.join(self.cache_dir, f"{symbol}_historical.json")
-                    with open(cache_file, 'w') as f:
-                        json.dump(historical_data.to_dict(), f)
-                    print(f"Cached {symbol} data")
+        # One bulk download covers most symbols in a single request
+        if len(symbols_to_fetch) > 1:
+            bulk = self.get_historical_bulk(symbols_to_fetch, start_date, end_date)
+            results.update(bulk)
+            symbols_to_fetch = [symbol for symbol in symbols_to_fetch if symbol not in bulk]
+            if not symbols_to_fetch:
+                return results
 
-            except Exception as e:
-                print(f"\nError fetching {symbol}: {str(e)}")
-                continue
+        # Fetch whatever is left concurrently; each is an independent HTTP round trip
+        max_workers = min(self.max_fetch_workers, len(symbols_to_fetch))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = list(executor.map(
+                lambda symbol: self._fetch_chart_data(symbol, start_date, end_date),
+                symbols_to_fetch
+            ))
+        
+        for symbol, historical_data in zip(symbols_to_fetch, fetched):
+            if historical_data is not None:
+                results[symbol] = historical_data
+                self.data_cache[symbol] = historical_data
+
+        return results
+
+    def get_historical_bulk(self, symbols: List[str], start_date: datetime, end_date: datetime) -> Dict[str, HistoricalData]:
+        """Download several symbols with a single yf.download call and cache each one"""
+        results = {}
+        try:
+            print(f"\nBulk fetching data for {len(symbols)} symbols...")
+            data = yf.download(
+                tickers=" ".join(symbols),
+                start=start_date.strftime('%Y-%m-%d'),
+                end=end_date.strftime('%Y-%m-%d'),
+                group_by='ticker',
+                threads=True,
+                progress=False
+            )
+        except Exception as e:
+            print(f"\nError in bulk fetch: {str(e)}")
+            return results
 
+        if data.empty:
+            return results
+
+        if len(symbols) == 1:
+            self._process_single_symbol_data(data, symbols[0], results)
+        else:
+            self._process_multiple_symbols_data(data, symbols, results)
         return results
 
+    def _fetch_chart_data(self, symbol: str, start_date: datetime, end_date: datetime) -> Optional[HistoricalData]:
+        """Fetch one symbol from the Yahoo chart API and cache it to file"""
+        try:
+            print(f"\nFetching data for {symbol}...")
+            period1 = int(start_date.timestamp())
+            period2 = int(end_date.timestamp())
+            
+            url = f'https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?period1={period1}&period2={period2}&interval=1d'
+            response = self.session.get(url)
+            response.raise_for_status()
+            
+            data = response.json()
+            if 'chart' not in data or 'result' not in data['chart'] or not data['chart']['result']:
+                print(f"Warning: No data returned for {symbol}")
+                return None
+                
+            result = data['chart']['result'][0]
+            timestamps = result['timestamp']
+            quote = result['indicators']['quote'][0]
+            
+            data_points = []
+            for i, ts in enumerate(timestamps):
+                if all(quote[field][i] is not None for field in ['open', 'high', 'low', 'close', 'volume']):
+                    data_points.append(DataPoint(
+                        date=datetime.fromtimestamp(ts).strftime('%Y-%m-%d'),
+                        open=float(quote['open'][i]),
+                        high=float(quote['high'][i]),
+                        low=float(quote['low'][i]),
+                        close=float(quote['close'][i]),
+                        volume=int(quote['volume'][i])
+                    ))
+            
+            if not data_points:
+                return None
+                
+            historical_data = HistoricalData(symbol=symbol, data_points=data_points)
+            
+            # Cache to file
+            self._write_historical_cache(symbol, historical_data)
+            print(f"Cached {symbol} data")
+            return historical_data
+
+        except Exception as e:
+            print(f"\nError fetching {symbol}: {str(e)}")
+            return None
+
     def _process_single_symbol_data(self, data: pd.DataFrame, symbol: str, results: Dict[str, HistoricalData]):
         """Process data for a single symbol"""
         if len(data) == 0:
             print(f"Warning: No data returned for {symbol}")
             return
             
-        data_points = []
-        for index, row in data.iterrows():
-            data_points.append(DataPoint(
-                date=index.strftime('%Y-%m-%d'),
-                open=float(row['Open']),
-                high=float(row['High']),
-                low=float(row['Low']),
-                close=float(row['Close']),
-                volume=int(row['Volume'])
-            ))
-        
-        if data_points:
-            historical_data = HistoricalData(symbol=symbol, data_points=data_points)
+        historical_data = HistoricalData.from_frame(symbol, data)
+        if historical_data.data_points:
             results[symbol] = historical_data
             self.data_cache[symbol] = historical_data  # Add to in-memory cache
             
             # Cache to file
-            cache_file = os.path.join(self.cache_dir, f"{symbol}_historical.json")
-            with open(cache_file, 'w') as f:
-                json.dump(historical_data.to_dict(), f)
+            self._write_historical_cache(symbol, historical_data)
             print(f"Cached {symbol} data")
 
     def _process_multiple_symbols_data(self, data: pd.DataFrame, symbols: List[str], results: Dict[str, HistoricalData]):
@@ -162,27 +277,15 @@ class MarketData:
                     print(f"Warning: No data returned for {symbol}")
                     continue
                     
-                symbol_data = data[symbol]
-                data_points = []
-                for index, row in symbol_data.iterrows():
-                    data_points.append(DataPoint(
-                        date=index.strftime('%Y-%m-%d'),
-                        open=float(row['Open']),
-                        high=float(row['High']),
-                        low=float(row['Low']),
-                        close=float(row['Close']),
-                        volume=int(row['Volume'])
-                    ))
-                
-                if data_points:
-                    historical_data = HistoricalData(symbol=symbol, data_points=data_points)
+                # Rows are aligned across tickers, so drop dates this symbol didn't trade
+                symbol_data = data.xs(symbol, level=0, axis=1).dropna()
+                historical_data = HistoricalData.from_frame(symbol, symbol_data)
+                if historical_data.data_points:
                     results[symbol] = historical_data
                     self.data_cache[symbol] = historical_data  # Add to in-memory cache
                     
                     # Cache to file
-                    cache_file = os.path.join(self.cache_dir, f"{symbol}_historical.json")
-                    with open(cache_file, 'w') as f:
-                        json.dump(historical_data.to_dict(), f)
+                    self._write_historical_cache(symbol, historical_data)
                     print(f"Cached {symbol} data")
             except Exception as e:
                 print(f"Error processing {symbol}: {str(e)}")
@@ -190,12 +293,11 @@ class MarketData:
 
     def _get_historical_data(self, symbol: str, start_date: datetime, end_date: datetime, force_refresh: bool) -> HistoricalData:
         """Get historical price data using yf.download"""
-        cache_file = os.path.join(self.cache_dir, f"{symbol}_historical.json")
-        
         # Try cache first
-        if not force_refresh and os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                return HistoricalData.from_dict(json.load(f))
+        if not force_refresh:
+            historical_data = self._try_read_historical_cache(symbol)
+            if historical_data is not None:
+                return historical_data
 
         # Fetch from Yahoo Finance with retries
         for attempt in range(self.max_retries):
@@ -213,25 +315,10 @@ class MarketData:
                     raise ValueError(f"Empty data received for {symbol}")
 
                 print(f"Received {len(data)} data points")
-                data_points = []
-                for index, row in data.iterrows():
-                    data_points.append(DataPoint(
-                        date=index.strftime('%Y-%m-%d'),
-                        open=float(row['Open']),
-                        high=float(row['High']),
-                        low=float(row['Low']),
-                        close=float(row['Close']),
-                        volume=int(row['Volume'])
-                    ))
-
-                historical_data = HistoricalData(
-                    symbol=symbol,
-                    data_points=sorted(data_points, key=lambda x: x.date)
-                )
+                historical_data = HistoricalData.from_frame(symbol, data.sort_index())
                 
                 # Cache the data
-                with open(cache_file, 'w') as f:
-                    json.dump(historical_data.to_dict(), f)
+                self._write_historical_cache(symbol, historical_data)
 
                 return historical_data
 
@@ -252,9 +339,12 @@ class MarketData:
         """Get basic fundamental data from Yahoo Finance"""
         cache_file = os.path.join(self.cache_dir, f"{symbol}_fundamental.json")
         
-        if not force_refresh and os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                return FundamentalData.from_dict(json.load(f))
+        if not force_refresh:
+            try:
+                with open(cache_file, 'rb') as f:
+                    return FundamentalData.from_dict(json.loads(f.read()))
+            except FileNotFoundError:
+                pass
 
         try:
             ticker = yf.Ticker(symbol)
@@ -271,8 +361,7 @@ class MarketData:
             )
 
             # Cache the data
-            with open(cache_file, 'w') as f:
-                json.dump(fundamental_data.to_dict(), f)
+            atomic_write_bytes(cache_file, json.dumps(fundamental_data.to_dict()).encode())
 
             return fundamental_data
 
@@ -1,8 +1,12 @@
+import hashlib
 import json
 import os
+import re
 from typing import Optional, Tuple, Dict, Any
 from datetime import datetime, timedelta
-from .data_types import HistoricalData, FundamentalData
+import numpy as np
+from .cache_io import atomic_write_bytes
+from .data_types import HistoricalData, FundamentalData, BacktestResult
 
 class CacheWriteError(Exception):
     """Custom exception for cache writing errors"""
@@ -11,21 +15,67 @@ class CacheWriteError(Exception):
 class MarketDataStorage:
     """Handles local storage of market data"""
     
+    # Bump when backtest logic changes in a way strategy parameters don't capture,
+    # so cached backtest results are recomputed
+    BACKTEST_CACHE_VERSION = 1
+    
     def __init__(self, cache_dir: str = "cache"):
         self.cache_dir = cache_dir
+        # Decoded cache files kept in memory, keyed with the file's mtime_ns so edits on disk invalidate them
+        self._historical_mem: Dict[Tuple[str, str, str], Tuple[int, HistoricalData]] = {}
+        self._fundamentals_mem: Dict[str, Tuple[int, datetime, FundamentalData]] = {}
         self._ensure_cache_dirs()
     
     def _ensure_cache_dirs(self):
         """Ensure cache directories exist"""
         os.makedirs(os.path.join(self.cache_dir, "historical"), exist_ok=True)
         os.makedirs(os.path.join(self.cache_dir, "fundamentals"), exist_ok=True)
+        os.makedirs(os.path.join(self.cache_dir, "backtests"), exist_ok=True)
     
     def _get_historical_cache_path(self, symbol: str) -> str:
         return os.path.join(self.cache_dir, "historical", f"{symbol}.json")
     
+    def _get_historical_index_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, "historical", f"{symbol}.index.json")
+    
+    def _read_historical_index(self, symbol: str, data_mtime_ns: int) -> Optional[Tuple[str, str]]:
+        """Date range covered by a historical cache file, from its small index sidecar
+        
+        Returns None when the index is missing or older than the data file.
+        """
+        index_path = self._get_historical_index_path(symbol)
+        try:
+            if os.stat(index_path).st_mtime_ns < data_mtime_ns:
+                return None
+            with open(index_path, 'rb') as f:
+                index = json.loads(f.read())
+            return index['start_date'], index['end_date']
+        except (OSError, ValueError, KeyError):
+            return None
+    
     def _get_fundamentals_cache_path(self, symbol: str) -> str:
         return os.path.join(self.cache_dir, "fundamentals", f"{symbol}.json")
     
+    def _get_backtest_cache_path(self, symbol: str, strategy_name: str) -> str:
+        strategy_slug = re.sub(r'[^A-Za-z0-9]+', '_', strategy_name).strip('_').lower()
+        return os.path.join(self.cache_dir, "backtests", f"{symbol}_{strategy_slug}.json")
+    
+    @classmethod
+    def _backtest_cache_key(cls, start_date: datetime, end_date: datetime, historical: HistoricalData,
+                            parameters: Optional[Dict[str, Any]] = None) -> str:
+        """Key a backtest on the cache version, strategy parameters, date range and a
+        digest of every bar, so corrected or re-adjusted history misses the cache"""
+        prefix = (f"v{cls.BACKTEST_CACHE_VERSION}|{json.dumps(parameters or {}, sort_keys=True, default=str)}|"
+                  f"{start_date:%Y-%m-%d}|{end_date:%Y-%m-%d}")
+        points = historical.data_points
+        if not points:
+            return f"{prefix}|empty"
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\n".join(point.date for point in points).encode())
+        for name in ('open', 'high', 'low', 'close', 'volume'):
+            digest.update(np.ascontiguousarray(historical.column(name), dtype=np.float64).tobytes())
+        return f"{prefix}|{len(points)}|{digest.hexdigest()}"
+    
     def _safe_write_json(self, path: str, data: dict):
         """Safely write data to JSON file with detailed error checking"""
         # First serialize to string to verify it's valid JSON
@@ -38,9 +88,8 @@ class MarketDataStorage:
         if not os.access(dir_path, os.W_OK):
             raise CacheWriteError(f"Directory is not writable: {dir_path}")
         
-        # Write to file
-        with open(path, 'w') as f:
-            f.write(json_str)
+        # Write via a temp file so a crash can't leave a truncated cache file
+        atomic_write_bytes(path, json_str.encode('utf-8'))
         
         # Verify the file was written correctly
         if not os.path.exists(path):
@@ -67,6 +116,22 @@ class MarketDataStorage:
         if not os.path.exists(cache_path) or os.path.getsize(cache_path) == 0:
             return None
         
+        key = (symbol, start_date, end_date)
+        mtime_ns = os.stat(cache_path).st_mtime_ns
+        cached = self._historical_mem.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        req_start = datetime.strptime(start_date, '%Y-%m-%d')
+        req_end = datetime.strptime(end_date, '%Y-%m-%d')
+        
+        # The index sidecar answers the coverage check without parsing the whole file
+        coverage = self._read_historical_index(symbol, mtime_ns)
+        if coverage is not None:
+            if not (datetime.strptime(coverage[0], '%Y-%m-%d') <= req_start
+                    and datetime.strptime(coverage[1], '%Y-%m-%d') >= req_end):
+                return None
+        
         # Try to read the file
         try:
             with open(cache_path, 'r') as f:
@@ -76,14 +141,20 @@ class MarketDataStorage:
             os.remove(cache_path)
             return None
         
-        # Check if cache covers the requested date range
-        cache_start = datetime.strptime(cache_data['start_date'], '%Y-%m-%d')
-        cache_end = datetime.strptime(cache_data['end_date'], '%Y-%m-%d')
-        req_start = datetime.strptime(start_date, '%Y-%m-%d')
-        req_end = datetime.strptime(end_date, '%Y-%m-%d')
+        # Check if cache covers the requested date range; files saved without an
+        # index sidecar carry no range keys, so take it from the bars' dates
+        if coverage is None:
+            dates = [point.get('date') for point in cache_data.get('data_points', ())]
+            if not dates or None in dates:
+                return None
+            coverage = (min(dates), max(dates))
+        cache_start = datetime.strptime(coverage[0], '%Y-%m-%d')
+        cache_end = datetime.strptime(coverage[1], '%Y-%m-%d')
         
         if cache_start <= req_start and cache_end >= req_end:
-            return HistoricalData.from_dict(cache_data)
+            data = HistoricalData.from_dict(cache_data)
+            self._historical_mem[key] = (mtime_ns, data)
+            return data
         
         return None
     
@@ -95,6 +166,15 @@ class MarketDataStorage:
         cache_path = self._get_historical_cache_path(symbol)
         cache_data = data.to_dict()
         self._safe_write_json(cache_path, cache_data)
+        # Written after the data file so its mtime marks it as current
+        dates = [point.date for point in data.data_points]
+        self._safe_write_json(self._get_historical_index_path(symbol), {
+            'start_date': min(dates),
+            'end_date': max(dates),
+            'row_count': len(dates)
+        })
+        for key in [key for key in self._historical_mem if key[0] == symbol]:
+            del self._historical_mem[key]
         print(f"Successfully wrote historical data to {cache_path}")
     
     def get_fundamentals(self, symbol: str) -> Optional[FundamentalData]:
@@ -105,22 +185,31 @@ class MarketDataStorage:
         if not os.path.exists(cache_path) or os.path.getsize(cache_path) == 0:
             return None
         
-        # Try to read the file
-        try:
-            with open(cache_path, 'r') as f:
-                cache_data = json.load(f)
-        except json.JSONDecodeError:
-            # Remove corrupted cache file
-            os.remove(cache_path)
-            return None
+        mtime_ns = os.stat(cache_path).st_mtime_ns
+        cached = self._fundamentals_mem.pop(symbol, None)
+        if cached is not None and cached[0] == mtime_ns:
+            _, last_updated, data = cached
+        else:
+            # Try to read the file
+            try:
+                with open(cache_path, 'r') as f:
+                    cache_data = json.load(f)
+            except json.JSONDecodeError:
+                # Remove corrupted cache file
+                os.remove(cache_path)
+                return None
+            last_updated = datetime.strptime(cache_data['last_updated'], '%Y-%m-%d %H:%M:%S')
+            data = None
         
         # Check if cache is expired (older than 1 day)
-        last_updated = datetime.strptime(cache_data['last_updated'], '%Y-%m-%d %H:%M:%S')
         if datetime.now() - last_updated > timedelta(days=1):
             os.remove(cache_path)  # Remove expired cache
             return None
         
-        return FundamentalData.from_dict(cache_data)
+        if data is None:
+            data = FundamentalData.from_dict(cache_data)
+        self._fundamentals_mem[symbol] = (mtime_ns, last_updated, data)
+        return data
     
     def save_fundamentals(self, symbol: str, data: FundamentalData):
         """Save fundamental data to cache"""
@@ -130,8 +219,43 @@ class MarketDataStorage:
         cache_path = self._get_fundamentals_cache_path(symbol)
         cache_data = data.to_dict()
         self._safe_write_json(cache_path, cache_data)
+        self._fundamentals_mem.pop(symbol, None)
         print(f"Successfully wrote fundamental data to {cache_path}")
     
+    def get_backtest(self, symbol: str, strategy_name: str, start_date: datetime,
+                     end_date: datetime, historical: HistoricalData,
+                     parameters: Optional[Dict[str, Any]] = None) -> Optional[BacktestResult]:
+        """Retrieve a cached backtest result if it was run on the same range, data and parameters"""
+        cache_path = self._get_backtest_cache_path(symbol, strategy_name)
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cache_data = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            # Remove corrupted cache file
+            os.remove(cache_path)
+            return None
+        
+        if cache_data.get('key') != self._backtest_cache_key(start_date, end_date, historical, parameters):
+            return None
+        
+        return BacktestResult.from_dict(cache_data['result'])
+    
+    def save_backtest(self, symbol: str, strategy_name: str, start_date: datetime,
+                      end_date: datetime, historical: HistoricalData, result: BacktestResult,
+                      parameters: Optional[Dict[str, Any]] = None):
+        """Save a backtest result to cache, replacing any earlier run for the pair"""
+        cache_path = self._get_backtest_cache_path(symbol, strategy_name)
+        cache_data = {
+            'key': self._backtest_cache_key(start_date, end_date, historical, parameters),
+            'result': result.to_dict()
+        }
+        
+        # default=float covers NumPy scalars in prices and returns
+        atomic_write_bytes(cache_path, json.dumps(cache_data, default=float).encode())
+    
     def validate_cache(self, symbol: str) -> Tuple[bool, Dict[str, str]]:
         """Validate that data was written correctly to cache files"""
         validation = {
@@ -9,13 +9,20 @@ actionable buy/sell/short triggers based on prediction accuracy progression.
 import json
 import os
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Tuple, Optional
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
-from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 import numpy as np
 
+@lru_cache(maxsize=1024)
+def _encode_strategies(strategies: Tuple[str, ...]) -> str:
+    """Compact JSON text for a strategy list; predictions reuse a handful of combinations"""
+    return json.dumps(list(strategies), separators=(',', ':'))
+
 @dataclass
 class PredictionRecord:
     """A single prediction record"""
@@ -72,17 +79,103 @@ class TradingTrigger:
 class PredictionTracker:
     """Main prediction performance tracking system"""
     
-    def __init__(self, db_path: str = "data/prediction_tracker.db"):
+    # WAL + NORMAL sync is durable across application crashes and avoids an
+    # fsync per transaction; callers can override any of these via ``pragmas``
+    DEFAULT_PRAGMAS: Dict[str, Any] = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'temp_store': 'MEMORY',
+        'cache_size': -65536,  # 64 MiB page cache, kept warm by the long-lived connection
+    }
+    
+    # Bump when the strategy performance calculation changes so persisted results are recomputed
+    PERF_CACHE_VERSION = 1
+    
+    def __init__(self, db_path: str = "data/prediction_tracker.db",
+                 pragmas: Optional[Dict[str, Any]] = None):
         self.db_path = db_path
         self.results_dir = "results"
         self.cache_dir = "cache"
+        self.pragmas = {**self.DEFAULT_PRAGMAS, **(pragmas or {})}
+        self._history_cache: Dict[str, Tuple[int, Any]] = {}
+        self._array_cache: Dict[str, Tuple[Any, Dict[str, np.ndarray]]] = {}
+        self._strategy_perf_cache: Optional[Tuple[str, Dict[str, StrategyPerformance]]] = None
+        self._conn: Optional[sqlite3.Connection] = None
         self.setup_database()
         
+    def _connect(self) -> sqlite3.Connection:
+        """Get the tracker's connection, opening it with the configured PRAGMAs on first use
+        
+        The connection is kept for the tracker's lifetime so prepared statements
+        are reused across calls; ``with self._connect() as conn`` still scopes a
+        transaction (commit on success, rollback on error).
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            for name, value in self.pragmas.items():
+                conn.execute(f"PRAGMA {name}={value}")
+            self._conn = conn
+        return self._conn
+        
+    def close(self):
+        """Close the tracker's database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            
+    def __enter__(self) -> 'PredictionTracker':
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        
+    def _load_historical_data(self, symbol: str) -> Optional[List[Dict[str, Any]]]:
+        """Load a symbol's cached price bars, reparsing only when the file changes
+        
+        Handles both the nested ``{"data_points": [...]}`` cache format and a bare
+        list of bars, so callers always get the list.
+        """
+        cache_file = f"{self.cache_dir}/{symbol}_historical.json"
+        try:
+            mtime_ns = os.stat(cache_file).st_mtime_ns
+        except OSError:
+            return None
+            
+        cached = self._history_cache.get(cache_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+            
+        with open(cache_file, 'rb') as f:
+            data = json.loads(f.read())
+        if isinstance(data, dict):
+            data = data.get('data_points', [])
+        self._history_cache[cache_file] = (mtime_ns, data)
+        return data
+        
+    def _load_price_arrays(self, symbol: str) -> Optional[Dict[str, np.ndarray]]:
+        """Column arrays (date/high/low/close) of a symbol's cached bars, rebuilt when the bars reload"""
+        data_points = self._load_historical_data(symbol)
+        if data_points is None:
+            return None
+            
+        cached = self._array_cache.get(symbol)
+        if cached is not None and cached[0] is data_points:
+            return cached[1]
+            
+        arrays = {
+            'date': np.array([day['date'] for day in data_points], dtype='datetime64[D]'),
+            'high': np.array([day['high'] for day in data_points], dtype=np.float64),
+            'low': np.array([day['low'] for day in data_points], dtype=np.float64),
+            'close': np.array([day['close'] for day in data_points], dtype=np.float64),
+        }
+        self._array_cache[symbol] = (data_points, arrays)
+        return arrays
+        
     def setup_database(self):
         """Initialize the prediction tracking database"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS predictions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -148,101 +241,152 @@ class PredictionTracker:
                 )
             """)
             
+            # Last computed strategy performance, keyed by the state of the evaluated predictions
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS perf_cache (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
             # Create indexes for better performance
             conn.execute("CREATE INDEX IF NOT EXISTS idx_predictions_symbol_date ON predictions(symbol, date_issued)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_strategy_performance_date ON strategy_performance(date_calculated)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_triggers_active ON trading_triggers(is_active, date_created)")
             
+            # Dedup key for INSERT OR IGNORE; databases created before the index
+            # existed may hold duplicates, which would make the CREATE fail
+            has_unique = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_predictions_uniq'"
+            ).fetchone()
+            if not has_unique:
+                conn.execute("""
+                    DELETE FROM predictions WHERE id NOT IN (
+                        SELECT MIN(id) FROM predictions GROUP BY symbol, date_issued, action
+                    )
+                """)
+                conn.execute("CREATE UNIQUE INDEX idx_predictions_uniq ON predictions(symbol, date_issued, action)")
+            
+    @staticmethod
+    def _read_recommendation_file(file_path: str) -> Optional[PredictionRecord]:
+        """Parse one recommendation file into a prediction record (None if it has no recommendation)"""
+        with open(file_path, 'rb') as f:
+            data = json.loads(f.read())
+        
+        # Extract info from filename
+        filename = os.path.basename(file_path)
+        parts = filename.replace('.json', '').split('_')
+        symbol = parts[0]
+        date_str = parts[2]
+        
+        # Convert YYYYMMDD to ISO; fromisoformat still validates the date
+        date_issued = date.fromisoformat(f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}").isoformat()
+        
+        # Create prediction record
+        rec = data.get('recommendations', {})
+        if not rec:
+            return None
+            
+        return PredictionRecord(
+            symbol=symbol,
+            date_issued=date_issued,
+            action=rec.get('action', ''),
+            type=rec.get('type', ''),
+            confidence=rec.get('confidence', 0.0),
+            entry_price=rec.get('entry_price', 0.0),
+            stop_loss=rec.get('stop_loss', 0.0),
+            take_profit=rec.get('take_profit', 0.0),
+            position_size=rec.get('position_size', 0),
+            strategies=rec.get('supporting_strategies', []),
+            details=rec.get('details', '')
+        )
+        
     def import_historical_predictions(self) -> int:
         """Import all existing recommendation files"""
         print("🔄 Importing historical predictions...")
-        imported_count = 0
-        
-        # Find all recommendation files
-        recommendation_files = glob.glob(f"{self.results_dir}/*_recommendations_*.json")
+        predictions = []
         
-        for file_path in recommendation_files:
+        # Find all recommendation files (same matches as *_recommendations_*.json)
+        try:
+            with os.scandir(self.results_dir) as entries:
+                recommendation_files = [
+                    entry.path for entry in entries
+                    if entry.name.endswith('.json') and not entry.name.startswith('.')
+                    and '_recommendations_' in entry.name[:-5]
+                ]
+        except FileNotFoundError:
+            recommendation_files = []
+            
+        def read(file_path):
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                # Extract info from filename
-                filename = os.path.basename(file_path)
-                parts = filename.replace('.json', '').split('_')
-                symbol = parts[0]
-                date_str = parts[2]
-                
-                # Convert date format
-                date_issued = datetime.strptime(date_str, '%Y%m%d').strftime('%Y-%m-%d')
-                
-                # Create prediction record
-                rec = data.get('recommendations', {})
-                if not rec:
-                    continue
-                    
-                prediction = PredictionRecord(
-                    symbol=symbol,
-                    date_issued=date_issued,
-                    action=rec.get('action', ''),
-                    type=rec.get('type', ''),
-                    confidence=rec.get('confidence', 0.0),
-                    entry_price=rec.get('entry_price', 0.0),
-                    stop_loss=rec.get('stop_loss', 0.0),
-                    take_profit=rec.get('take_profit', 0.0),
-                    position_size=rec.get('position_size', 0),
-                    strategies=rec.get('supporting_strategies', []),
-                    details=rec.get('details', '')
-                )
-                
-                self.store_prediction(prediction)
-                imported_count += 1
-                
+                return self._read_recommendation_file(file_path), None
             except Exception as e:
-                print(f"⚠️  Error importing {file_path}: {e}")
-                continue
+                return None, e
                 
+        # Files are independent, so overlap their reads; map keeps directory order
+        if recommendation_files:
+            with ThreadPoolExecutor(max_workers=min(16, len(recommendation_files))) as executor:
+                for file_path, (prediction, error) in zip(recommendation_files,
+                                                          executor.map(read, recommendation_files)):
+                    if error is not None:
+                        print(f"⚠️  Error importing {file_path}: {error}")
+                    elif prediction is not None:
+                        predictions.append(prediction)
+                        
+        # Write everything in one transaction per batch instead of a commit per file
+        self.store_predictions(predictions)
+        
+        imported_count = len(predictions)
         print(f"✅ Imported {imported_count} historical predictions")
         return imported_count
         
     def store_prediction(self, prediction: PredictionRecord):
         """Store a prediction in the database"""
-        with sqlite3.connect(self.db_path) as conn:
-            # Check if already exists
-            cursor = conn.execute("""
-                SELECT id FROM predictions 
-                WHERE symbol = ? AND date_issued = ? AND action = ?
-            """, (prediction.symbol, prediction.date_issued, prediction.action))
-            
-            if cursor.fetchone():
-                return  # Already exists
+        self.store_predictions([prediction])
+        
+    def store_predictions(self, predictions: List[PredictionRecord], batch_size: int = 10000) -> int:
+        """Store predictions in bulk, skipping ones that are already recorded
+        
+        Returns:
+            Number of newly inserted predictions
+        """
+        if not predictions:
+            return 0
+            
+        rows = [(
+            prediction.symbol, prediction.date_issued, prediction.action, prediction.type,
+            prediction.confidence, prediction.entry_price, prediction.stop_loss,
+            prediction.take_profit, prediction.position_size,
+            _encode_strategies(tuple(prediction.strategies)), prediction.details,
+            prediction.outcome, prediction.actual_exit_price, prediction.actual_exit_date,
+            prediction.pnl, prediction.return_pct, prediction.days_held
+        ) for prediction in predictions]
+        
+        inserted = 0
+        with self._connect() as conn:
+            # The unique (symbol, date_issued, action) index skips ones already stored
+            for start in range(0, len(rows), batch_size):
+                before = conn.total_changes
+                conn.executemany("""
+                    INSERT OR IGNORE INTO predictions (
+                        symbol, date_issued, action, type, confidence, entry_price,
+                        stop_loss, take_profit, position_size, strategies, details,
+                        outcome, actual_exit_price, actual_exit_date, pnl, return_pct, days_held
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows[start:start + batch_size])
+                inserted += conn.total_changes - before
+                conn.commit()
                 
-            conn.execute("""
-                INSERT INTO predictions (
-                    symbol, date_issued, action, type, confidence, entry_price,
-                    stop_loss, take_profit, position_size, strategies, details,
-                    outcome, actual_exit_price, actual_exit_date, pnl, return_pct, days_held
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                prediction.symbol, prediction.date_issued, prediction.action, prediction.type,
-                prediction.confidence, prediction.entry_price, prediction.stop_loss,
-                prediction.take_profit, prediction.position_size,
-                json.dumps(prediction.strategies), prediction.details,
-                prediction.outcome, prediction.actual_exit_price, prediction.actual_exit_date,
-                prediction.pnl, prediction.return_pct, prediction.days_held
-            ))
+        return inserted
             
     def get_current_price(self, symbol: str) -> Optional[float]:
         """Get the current price for a symbol from historical data cache"""
-        cache_file = f"{self.cache_dir}/{symbol}_historical.json"
-        if not os.path.exists(cache_file):
-            return None
-            
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
+            data_points = self._load_historical_data(symbol)
             
-            if data and len(data) > 0:
-                return float(data[-1].get('close', 0))
+            if data_points:
+                return float(data_points[-1].get('close', 0))
         except:
             pass
             
@@ -251,9 +395,8 @@ class PredictionTracker:
     def update_prediction_outcomes(self) -> int:
         """Update outcomes for predictions that can be evaluated"""
         print("🔄 Updating prediction outcomes...")
-        updated_count = 0
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # Get predictions without outcomes
             cursor = conn.execute("""
                 SELECT id, symbol, date_issued, action, type, entry_price, stop_loss, take_profit
@@ -262,28 +405,31 @@ class PredictionTracker:
                 ORDER BY date_issued
             """)
             
-            predictions = cursor.fetchall()
-            
-            for pred in predictions:
-                pred_id, symbol, date_issued, action, pred_type, entry_price, stop_loss, take_profit = pred
-                
-                # Get historical price data for evaluation
-                outcome = self.evaluate_prediction_outcome(
-                    symbol, date_issued, action, pred_type, entry_price, stop_loss, take_profit
+            # Find each prediction's exit bar, then score all of them in one batch
+            exits = []
+            for pred_id, symbol, date_issued, action, pred_type, entry_price, stop_loss, take_profit in cursor:
+                exit_info = self._find_exit(symbol, date_issued, pred_type, stop_loss, take_profit)
+                if exit_info:
+                    exits.append((pred_id, pred_type, entry_price) + exit_info)
+                    
+            updates = []
+            if exits:
+                pred_ids, pred_types, entry_prices, exit_prices, days_held, exit_dates, outcome_types = zip(*exits)
+                outcomes, pnls, return_pcts = self.calculate_outcomes_batch(
+                    pred_types, entry_prices, exit_prices, outcome_types
                 )
+                updates = list(zip(outcomes.tolist(), exit_prices, exit_dates, pnls.tolist(),
+                                   return_pcts.tolist(), days_held, pred_ids))
                 
-                if outcome:
-                    conn.execute("""
-                        UPDATE predictions 
-                        SET outcome = ?, actual_exit_price = ?, actual_exit_date = ?, 
-                            pnl = ?, return_pct = ?, days_held = ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (
-                        outcome['outcome'], outcome['exit_price'], outcome['exit_date'],
-                        outcome['pnl'], outcome['return_pct'], outcome['days_held'], pred_id
-                    ))
-                    updated_count += 1
-                    
+            # Write every evaluated outcome in one statement within the same transaction
+            conn.executemany("""
+                UPDATE predictions 
+                SET outcome = ?, actual_exit_price = ?, actual_exit_date = ?, 
+                    pnl = ?, return_pct = ?, days_held = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, updates)
+            updated_count = len(updates)
+            
         print(f"✅ Updated {updated_count} prediction outcomes")
         return updated_count
         
@@ -291,74 +437,63 @@ class PredictionTracker:
                                   pred_type: str, entry_price: float, stop_loss: float, 
                                   take_profit: float) -> Optional[Dict]:
         """Evaluate if a prediction was successful based on historical data"""
-        cache_file = f"{self.cache_dir}/{symbol}_historical.json"
-        if not os.path.exists(cache_file):
+        exit_info = self._find_exit(symbol, date_issued, pred_type, stop_loss, take_profit)
+        if exit_info is None:
             return None
             
+        exit_price, days_held, exit_date, outcome_type = exit_info
+        return self.calculate_outcome(
+            action, pred_type, entry_price, exit_price, stop_loss, take_profit,
+            days_held, exit_date, outcome_type
+        )
+        
+    def _find_exit(self, symbol: str, date_issued: str, pred_type: str, stop_loss: float,
+                   take_profit: float) -> Optional[Tuple[float, int, str, str]]:
+        """Find where a prediction exits: (exit price, days held, exit date, outcome type)
+        
+        Returns None while the prediction is still open or there's no price history.
+        """
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-                # Extract the data_points array from the nested structure
-                if 'data_points' in data:
-                    data_points = data['data_points']
-                else:
-                    # Fallback for direct array format
-                    data_points = data
+            prices = self._load_price_arrays(symbol)
+            if prices is None:
+                return None
         except:
             return None
             
-        # Find prices after the prediction date
-        start_date = datetime.strptime(date_issued, '%Y-%m-%d')
+        # Bars after the prediction date, in file order
+        start_date = np.datetime64(date_issued, 'D')
+        after = prices['date'] > start_date
+        dates = prices['date'][after]
         max_days = 30  # Maximum holding period
+        days = (dates - start_date).astype(np.int64)
+        
+        # Stop/target hits only count before the holding period runs out
+        over = np.flatnonzero(days > max_days)
+        timeout_idx = int(over[0]) if over.size else None
+        end = len(dates) if timeout_idx is None else timeout_idx
         
-        for i, day_data in enumerate(data_points):
-            day_date = datetime.strptime(day_data['date'], '%Y-%m-%d')
+        if pred_type == "LONG":
+            stop_hits = prices['low'][after][:end] <= stop_loss
+            target_hits = prices['high'][after][:end] >= take_profit
+        elif pred_type == "SHORT":
+            stop_hits = prices['high'][after][:end] >= stop_loss
+            target_hits = prices['low'][after][:end] <= take_profit
+        else:
+            stop_hits = target_hits = np.zeros(0, dtype=bool)
+            
+        stop_idx = int(np.argmax(stop_hits)) if stop_hits.any() else end
+        target_idx = int(np.argmax(target_hits)) if target_hits.any() else end
+        
+        # Stop loss is checked first when both trigger on the same bar
+        if stop_idx < end and stop_idx <= target_idx:
+            return stop_loss, int(days[stop_idx]), str(dates[stop_idx]), 'stop_loss'
+        if target_idx < end:
+            return take_profit, int(days[target_idx]), str(dates[target_idx]), 'target_hit'
+        if timeout_idx is not None:
+            # Timeout - evaluate at that day's close
+            exit_price = float(prices['close'][after][timeout_idx])
+            return exit_price, int(days[timeout_idx]), str(dates[timeout_idx]), 'timeout'
             
-            if day_date <= start_date:
-                continue
-                
-            days_held = (day_date - start_date).days
-            if days_held > max_days:
-                # Timeout - evaluate at current price
-                exit_price = float(day_data['close'])
-                return self.calculate_outcome(
-                    action, pred_type, entry_price, exit_price, stop_loss, take_profit,
-                    days_held, day_date.strftime('%Y-%m-%d'), 'timeout'
-                )
-                
-            high = float(day_data['high'])
-            low = float(day_data['low'])
-            close = float(day_data['close'])
-            
-            # Check for stop loss or take profit hits
-            if pred_type == "LONG":
-                if low <= stop_loss:
-                    # Stop loss hit
-                    return self.calculate_outcome(
-                        action, pred_type, entry_price, stop_loss, stop_loss, take_profit,
-                        days_held, day_date.strftime('%Y-%m-%d'), 'stop_loss'
-                    )
-                elif high >= take_profit:
-                    # Take profit hit
-                    return self.calculate_outcome(
-                        action, pred_type, entry_price, take_profit, stop_loss, take_profit,
-                        days_held, day_date.strftime('%Y-%m-%d'), 'target_hit'
-                    )
-                    
-            elif pred_type == "SHORT":
-                if high >= stop_loss:
-                    # Stop loss hit
-                    return self.calculate_outcome(
-                        action, pred_type, entry_price, stop_loss, stop_loss, take_profit,
-                        days_held, day_date.strftime('%Y-%m-%d'), 'stop_loss'
-                    )
-                elif low <= take_profit:
-                    # Take profit hit
-                    return self.calculate_outcome(
-                        action, pred_type, entry_price, take_profit, stop_loss, take_profit,
-                        days_held, day_date.strftime('%Y-%m-%d'), 'target_hit'
-                    )
-                    
         return None
         
     def calculate_outcome(self, action: str, pred_type: str, entry_price: float, 
@@ -392,75 +527,101 @@ class PredictionTracker:
             'days_held': days_held
         }
         
+    @staticmethod
+    def calculate_outcomes_batch(pred_types, entry_prices, exit_prices,
+                                 outcome_types) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized calculate_outcome: (outcome, pnl, return_pct) arrays for many predictions"""
+        pred_types = np.asarray(pred_types)
+        outcome_types = np.asarray(outcome_types)
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        exit_prices = np.asarray(exit_prices, dtype=np.float64)
+        
+        # +1 for LONG, -1 for SHORT; other types have no P&L
+        sign = (pred_types == "LONG").astype(np.float64) - (pred_types == "SHORT")
+        directional = sign != 0
+        pnl = np.where(directional, sign * (exit_prices - entry_prices), 0.0)
+        return_pct = np.divide(pnl, entry_prices, out=np.zeros_like(pnl), where=directional)
+        
+        # Targets succeed, stops fail, and anything else (timeout) succeeds on a gain
+        success = (outcome_types == 'target_hit') | ((outcome_types != 'stop_loss') & (return_pct > 0))
+        outcome = np.where(success, 'success', 'failure')
+        return outcome, pnl, return_pct
+        
+    def _perf_cache_key(self, conn: sqlite3.Connection) -> str:
+        """Key for the persisted strategy performance, changing when evaluated predictions do"""
+        count, max_id, last_update = conn.execute("""
+            SELECT COUNT(*), MAX(id), MAX(updated_at) FROM predictions WHERE outcome IS NOT NULL
+        """).fetchone()
+        return f"v{self.PERF_CACHE_VERSION}:{count}:{max_id}:{last_update}"
+        
     def calculate_strategy_performance(self) -> Dict[str, StrategyPerformance]:
-        """Calculate performance metrics for each strategy"""
+        """Calculate performance metrics for each strategy
+        
+        The result is reused until the evaluated predictions change, so the trigger
+        pass and the report in a single run share one aggregation. It is also
+        persisted in ``perf_cache`` so later runs skip the aggregation too.
+        """
+        with self._connect() as conn:
+            cache_key = self._perf_cache_key(conn)
+            if self._strategy_perf_cache is not None and self._strategy_perf_cache[0] == cache_key:
+                return self._strategy_perf_cache[1]
+            cached = conn.execute("SELECT payload FROM perf_cache WHERE key = ?", (cache_key,)).fetchone()
+        if cached is not None:
+            performance = {
+                perf['strategy_name']: StrategyPerformance(**perf) for perf in json.loads(cached[0])
+            }
+            self._strategy_perf_cache = (cache_key, performance)
+            return performance
+            
         print("📊 Calculating strategy performance...")
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT strategies, outcome, return_pct, days_held, pnl
-                FROM predictions 
-                WHERE outcome IS NOT NULL
+        # Expand each prediction's strategy list with json_each and let SQLite do
+        # the per-strategy counts and sums; strategies come back in order of first
+        # appearance (prediction id, then position in its list)
+        with self._connect() as conn:
+            totals = conn.execute("""
+                SELECT s.value,
+                       COUNT(*),
+                       SUM(p.outcome = 'success'),
+                       AVG(CASE WHEN p.days_held > 0 THEN p.days_held END),
+                       COALESCE(SUM(p.return_pct > 0), 0),
+                       SUM(CASE WHEN p.return_pct > 0 THEN p.return_pct END),
+                       SUM(CASE WHEN p.return_pct < 0 THEN -p.return_pct END)
+                FROM predictions p, json_each(p.strategies) s
+                WHERE p.outcome IS NOT NULL AND json_valid(p.strategies)
+                GROUP BY s.value
+                ORDER BY MIN((p.id << 16) + s.key)
+            """).fetchall()
+            
+            # Sharpe and drawdown depend on the return sequence, so stream it per strategy
+            # in id order and reduce each strategy's returns as soon as its rows end
+            return_rows = conn.execute("""
+                SELECT s.value, COALESCE(p.return_pct, 0)
+                FROM predictions p, json_each(p.strategies) s
+                WHERE p.outcome IS NOT NULL AND json_valid(p.strategies)
+                ORDER BY s.value, p.id, s.key
             """)
+            sequence_stats = {
+                strategy: self._return_sequence_stats(np.fromiter(map(itemgetter(1), rows), dtype=np.float64))
+                for strategy, rows in groupby(return_rows, key=itemgetter(0))
+            }
             
-            results = cursor.fetchall()
-            
-        # Group by strategy
-        strategy_data = defaultdict(list)
-        
-        for strategies_json, outcome, return_pct, days_held, pnl in results:
-            try:
-                strategies = json.loads(strategies_json)
-                for strategy in strategies:
-                    strategy_data[strategy].append({
-                        'outcome': outcome,
-                        'return_pct': return_pct or 0,
-                        'days_held': days_held or 0,
-                        'pnl': pnl or 0
-                    })
-            except:
-                continue
-                
         # Calculate metrics for each strategy
         performance = {}
         
-        for strategy_name, data in strategy_data.items():
-            total = len(data)
-            successful = len([d for d in data if d['outcome'] == 'success'])
+        for strategy_name, total, successful, avg_days_held, wins, gross_profit, gross_loss in totals:
             failed = total - successful
+            avg_return, sharpe_ratio, max_drawdown = sequence_stats[strategy_name]
             
-            returns = [d['return_pct'] for d in data]
-            days = [d['days_held'] for d in data if d['days_held'] > 0]
-            
-            accuracy_rate = successful / total if total > 0 else 0
-            avg_return = np.mean(returns) if returns else 0
-            avg_days_held = np.mean(days) if days else 0
+            accuracy_rate = successful / total
+            avg_days_held = avg_days_held or 0
             
             # Calculate additional metrics
-            win_rate = len([r for r in returns if r > 0]) / total if total > 0 else 0
+            win_rate = wins / total
             
             # Profit factor (gross profit / gross loss)
-            profits = [r for r in returns if r > 0]
-            losses = [abs(r) for r in returns if r < 0]
-            profit_factor = sum(profits) / sum(losses) if losses else float('inf')
+            profit_factor = (gross_profit or 0) / gross_loss if gross_loss is not None else float('inf')
             
-            # Simple Sharpe ratio approximation
-            if len(returns) > 1:
-                sharpe_ratio = np.mean(returns) / np.std(returns) if np.std(returns) > 0 else 0
-            else:
-                sharpe_ratio = 0
-                
-            # Max drawdown (simplified)
-            cumulative_returns = np.cumsum(returns)
-            max_drawdown = 0
-            peak = 0
-            for cum_return in cumulative_returns:
-                if cum_return > peak:
-                    peak = cum_return
-                drawdown = peak - cum_return
-                if drawdown > max_drawdown:
-                    max_drawdown = drawdown
-                    
             performance[strategy_name] = StrategyPerformance(
                 strategy_name=strategy_name,
                 total_predictions=total,
@@ -475,8 +636,32 @@ class PredictionTracker:
                 max_drawdown=max_drawdown
             )
             
+        with self._connect() as conn:
+            conn.execute("DELETE FROM perf_cache WHERE key != ?", (cache_key,))
+            conn.execute("INSERT OR REPLACE INTO perf_cache (key, payload) VALUES (?, ?)",
+                         (cache_key, json.dumps([asdict(perf) for perf in performance.values()])))
+            
+        self._strategy_perf_cache = (cache_key, performance)
         return performance
         
+    @staticmethod
+    def _return_sequence_stats(returns: np.ndarray) -> Tuple[float, float, float]:
+        """Mean return, Sharpe approximation and max drawdown of one strategy's returns"""
+        avg_return = returns.mean()
+        
+        # Simple Sharpe ratio approximation
+        if len(returns) > 1:
+            std = returns.std()
+            sharpe_ratio = avg_return / std if std > 0 else 0
+        else:
+            sharpe_ratio = 0
+            
+        # Max drawdown (simplified): running peak of the cumulative returns, starting from 0
+        cumulative_returns = np.cumsum(returns)
+        peaks = np.maximum.accumulate(np.maximum(cumulative_returns, 0))
+        max_drawdown = float((peaks - cumulative_returns).max())
+        return avg_return, sharpe_ratio, max_drawdown
+        
     def generate_trading_triggers(self) -> List[TradingTrigger]:
         """Generate actionable trading triggers based on prediction performance"""
         print("🎯 Generating trading triggers...")
@@ -484,21 +669,26 @@ class PredictionTracker:
         # Get strategy performance
         strategy_performance = self.calculate_strategy_performance()
         
-        # Get recent predictions for trend analysis
-        with sqlite3.connect(self.db_path) as conn:
+        # Get each symbol's last 5 recent predictions (all the progression analysis
+        # looks at), newest first with same-day ones in insertion order
+        with self._connect() as conn:
             cursor = conn.execute("""
                 SELECT symbol, action, confidence, strategies, date_issued, entry_price, stop_loss, take_profit
-                FROM predictions 
-                WHERE date_issued >= date('now', '-30 days')
-                ORDER BY symbol, date_issued DESC
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY symbol ORDER BY date_issued DESC, id
+                    ) AS rn
+                    FROM predictions
+                    WHERE date_issued >= date('now', '-30 days')
+                )
+                WHERE rn <= 5
+                ORDER BY symbol, rn
             """)
-            recent_predictions = cursor.fetchall()
-            
-        # Group by symbol for analysis
-        symbol_data = defaultdict(list)
-        for pred in recent_predictions:
-            symbol_data[pred[0]].append(pred)
+            symbol_data = {symbol: list(rows) for symbol, rows in groupby(cursor, key=itemgetter(0))}
             
+        # Strategy reliability doesn't depend on the symbol, so filter and score once
+        reliable, backing_scores = self._reliable_strategies(strategy_performance)
+        
         triggers = []
         
         for symbol, predictions in symbol_data.items():
@@ -506,7 +696,8 @@ class PredictionTracker:
                 continue
                 
             # Analyze prediction progression
-            trigger = self.analyze_prediction_progression(symbol, predictions, strategy_performance)
+            trigger = self.analyze_prediction_progression(symbol, predictions, strategy_performance,
+                                                          reliable, backing_scores)
             if trigger:
                 triggers.append(trigger)
                 
@@ -515,10 +706,29 @@ class PredictionTracker:
         
         return triggers
         
+    @staticmethod
+    def _reliable_strategies(strategy_performance: Dict[str, StrategyPerformance]
+                             ) -> Tuple[Dict[str, StrategyPerformance], Dict[str, float]]:
+        """Strategies trusted to back a trigger, and each one's backing score (accuracy x win rate)"""
+        reliable = {
+            name: perf for name, perf in strategy_performance.items()
+            if perf.accuracy_rate > 0.6 and perf.total_predictions >= 5
+        }
+        backing_scores = {name: perf.accuracy_rate * perf.win_rate for name, perf in reliable.items()}
+        return reliable, backing_scores
+        
     def analyze_prediction_progression(self, symbol: str, predictions: List, 
-                                     strategy_performance: Dict[str, StrategyPerformance]) -> Optional[TradingTrigger]:
-        """Analyze how predictions for a symbol are progressing"""
+                                     strategy_performance: Dict[str, StrategyPerformance],
+                                     reliable: Optional[Dict[str, StrategyPerformance]] = None,
+                                     backing_scores: Optional[Dict[str, float]] = None) -> Optional[TradingTrigger]:
+        """Analyze how predictions for a symbol are progressing
         
+        ``reliable`` and ``backing_scores`` come from ``_reliable_strategies``;
+        they are derived from ``strategy_performance`` when not passed in.
+        """
+        if reliable is None or backing_scores is None:
+            reliable, backing_scores = self._reliable_strategies(strategy_performance)
+            
         current_price = self.get_current_price(symbol)
         if not current_price:
             return None
@@ -537,11 +747,10 @@ class PredictionTracker:
         reliable_strategies = []
         
         for strategy in latest_strategies:
-            if strategy in strategy_performance:
-                perf = strategy_performance[strategy]
-                if perf.accuracy_rate > 0.6 and perf.total_predictions >= 5:
-                    backing_strength += perf.accuracy_rate * perf.win_rate
-                    reliable_strategies.append(strategy)
+            score = backing_scores.get(strategy)
+            if score is not None:
+                backing_strength += score
+                reliable_strategies.append(strategy)
                     
         # Analyze consistency in recent predictions
         recent_actions = [p[1] for p in predictions[:5]]  # Last 5 predictions
@@ -566,7 +775,7 @@ class PredictionTracker:
                 risk_level = "HIGH"
                 
             # Time horizon based on strategy performance
-            avg_days = np.mean([strategy_performance[s].avg_days_held for s in reliable_strategies])
+            avg_days = np.mean([reliable[s].avg_days_held for s in reliable_strategies])
             if avg_days <= 5:
                 time_horizon = "SHORT"
             elif avg_days <= 15:
@@ -576,7 +785,7 @@ class PredictionTracker:
                 
             reasoning = f"Consistent {latest_action} signal with {action_consistency:.1%} consistency. " \
                        f"Backed by {len(reliable_strategies)} reliable strategies with avg accuracy: " \
-                       f"{np.mean([strategy_performance[s].accuracy_rate for s in reliable_strategies]):.1%}"
+                       f"{np.mean([reliable[s].accuracy_rate for s in reliable_strategies]):.1%}"
             
             return TradingTrigger(
                 symbol=symbol,
@@ -596,89 +805,104 @@ class PredictionTracker:
         
     def store_triggers(self, triggers: List[TradingTrigger]):
         """Store trading triggers in the database"""
-        today = datetime.now().strftime('%Y-%m-%d')
+        today = date.today().isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # Deactivate old triggers
             conn.execute("UPDATE trading_triggers SET is_active = 0 WHERE date_created < ?", (today,))
             
-            # Insert new triggers
-            for trigger in triggers:
-                conn.execute("""
-                    INSERT INTO trading_triggers (
-                        symbol, action, confidence, reasoning, strategy_backing,
-                        entry_price, stop_loss, take_profit, position_size,
-                        risk_level, time_horizon, date_created
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    trigger.symbol, trigger.action, trigger.confidence, trigger.reasoning,
-                    json.dumps(trigger.strategy_backing), trigger.entry_price,
-                    trigger.stop_loss, trigger.take_profit, trigger.position_size,
-                    trigger.risk_level, trigger.time_horizon, today
-                ))
-                
+            # Insert new triggers with one prepared statement
+            conn.executemany("""
+                INSERT INTO trading_triggers (
+                    symbol, action, confidence, reasoning, strategy_backing,
+                    entry_price, stop_loss, take_profit, position_size,
+                    risk_level, time_horizon, date_created
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(
+                trigger.symbol, trigger.action, trigger.confidence, trigger.reasoning,
+                _encode_strategies(tuple(trigger.strategy_backing)), trigger.entry_price,
+                trigger.stop_loss, trigger.take_profit, trigger.position_size,
+                trigger.risk_level, trigger.time_horizon, today
+            ) for trigger in triggers])
+            
     def generate_performance_report(self) -> str:
         """Generate a comprehensive performance report"""
+        return "\n".join(self._iter_report_lines())
+        
+    def iter_performance_report(self):
+        """Yield the performance report as UTF-8 encoded lines, ready for a binary file"""
+        for line in self._iter_report_lines():
+            yield line.encode('utf-8') + b"\n"
+            
+    def _iter_report_lines(self):
+        """Yield the lines of the performance report"""
         strategy_performance = self.calculate_strategy_performance()
         triggers = self.get_active_triggers()
         
-        report = []
-        report.append("# 📈 PREDICTION PERFORMANCE REPORT")
-        report.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("")
+        yield "# 📈 PREDICTION PERFORMANCE REPORT"
+        yield f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        yield ""
         
         # Strategy Performance Summary
-        report.append("## 🎯 STRATEGY PERFORMANCE")
-        report.append("")
+        yield "## 🎯 STRATEGY PERFORMANCE"
+        yield ""
         
         for strategy_name, perf in sorted(strategy_performance.items(), 
                                         key=lambda x: x[1].accuracy_rate, reverse=True):
-            report.append(f"### {strategy_name}")
-            report.append(f"- **Accuracy Rate:** {perf.accuracy_rate:.1%}")
-            report.append(f"- **Win Rate:** {perf.win_rate:.1%}")
-            report.append(f"- **Avg Return:** {perf.avg_return:.2%}")
-            report.append(f"- **Total Predictions:** {perf.total_predictions}")
-            report.append(f"- **Profit Factor:** {perf.profit_factor:.2f}")
-            report.append(f"- **Sharpe Ratio:** {perf.sharpe_ratio:.2f}")
-            report.append(f"- **Avg Days Held:** {perf.avg_days_held:.1f}")
-            report.append("")
+            yield f"### {strategy_name}"
+            yield f"- **Accuracy Rate:** {perf.accuracy_rate:.1%}"
+            yield f"- **Win Rate:** {perf.win_rate:.1%}"
+            yield f"- **Avg Return:** {perf.avg_return:.2%}"
+            yield f"- **Total Predictions:** {perf.total_predictions}"
+            yield f"- **Profit Factor:** {perf.profit_factor:.2f}"
+            yield f"- **Sharpe Ratio:** {perf.sharpe_ratio:.2f}"
+            yield f"- **Avg Days Held:** {perf.avg_days_held:.1f}"
+            yield ""
             
         # Active Trading Triggers
-        report.append("## 🚨 ACTIVE TRADING TRIGGERS")
-        report.append("")
+        yield "## 🚨 ACTIVE TRADING TRIGGERS"
+        yield ""
         
         if triggers:
             for trigger in triggers:
-                report.append(f"### {trigger.symbol} - {trigger.action}")
-                report.append(f"- **Confidence:** {trigger.confidence:.1%}")
-                report.append(f"- **Risk Level:** {trigger.risk_level}")
-                report.append(f"- **Position Size:** {trigger.position_size} shares")
-                report.append(f"- **Entry Price:** ${trigger.entry_price:.2f}")
-                report.append(f"- **Stop Loss:** ${trigger.stop_loss:.2f}")
-                report.append(f"- **Take Profit:** ${trigger.take_profit:.2f}")
-                report.append(f"- **Time Horizon:** {trigger.time_horizon}")
-                report.append(f"- **Reasoning:** {trigger.reasoning}")
-                report.append("")
+                yield f"### {trigger.symbol} - {trigger.action}"
+                yield f"- **Confidence:** {trigger.confidence:.1%}"
+                yield f"- **Risk Level:** {trigger.risk_level}"
+                yield f"- **Position Size:** {trigger.position_size} shares"
+                yield f"- **Entry Price:** ${trigger.entry_price:.2f}"
+                yield f"- **Stop Loss:** ${trigger.stop_loss:.2f}"
+                yield f"- **Take Profit:** ${trigger.take_profit:.2f}"
+                yield f"- **Time Horizon:** {trigger.time_horizon}"
+                yield f"- **Reasoning:** {trigger.reasoning}"
+                yield ""
         else:
-            report.append("*No active trading triggers at this time.*")
-            report.append("")
+            yield "*No active trading triggers at this time.*"
+            yield ""
             
-        return "\n".join(report)
+    def get_active_triggers(self, limit: Optional[int] = None) -> List[TradingTrigger]:
+        """Get active trading triggers, highest confidence first
         
-    def get_active_triggers(self) -> List[TradingTrigger]:
-        """Get all active trading triggers"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
+        Args:
+            limit: Optional maximum number of triggers to return
+        """
+        query = """
                 SELECT symbol, action, confidence, reasoning, strategy_backing,
                        entry_price, stop_loss, take_profit, position_size,
                        risk_level, time_horizon
                 FROM trading_triggers 
                 WHERE is_active = 1
                 ORDER BY confidence DESC
-            """)
+            """
+        params = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (limit,)
+            
+        with self._connect() as conn:
+            cursor = conn.execute(query, params)
             
             triggers = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 triggers.append(TradingTrigger(
                     symbol=row[0],
                     action=row[1],
@@ -695,6 +919,12 @@ class PredictionTracker:
                 
         return triggers
         
+    def count_active_triggers(self) -> int:
+        """Count active trading triggers without loading them"""
+        with self._connect() as conn:
+            cursor = conn.execute("SELECT COUNT(*) FROM trading_triggers WHERE is_active = 1")
+            return cursor.fetchone()[0]
+        
     def run_full_analysis(self) -> str:
         """Run the complete prediction tracking analysis"""
         print("🚀 Starting Prediction Performance Analysis...")
@@ -17,15 +17,16 @@ class RecommendationEngine:
     ) -> Dict[str, Any]:
         """Generate trading recommendations by combining analysis and backtest results"""
         recommendations = {}
+        risk_per_trade = self.account_size * 0.02  # 2% risk per trade
         
         for symbol in symbols:
-            # Collect signals from all strategies
-            signals = []
+            # Collect signals from all strategies, bucketed by signal type
+            signals_by_type = {}
             for strategy_name, analysis in analysis_results.items():
-                if symbol not in analysis:
+                signal_data = analysis.get(symbol)
+                if signal_data is None:
                     continue
                     
-                signal_data = analysis[symbol]
                 if signal_data["signal"] != "hold" and signal_data["confidence"] >= self.min_confidence:
                     # Get current price from metrics, with fallback
                     metrics = signal_data.get("metrics", {})
@@ -58,7 +59,7 @@ class RecommendationEngine:
                         stop_loss = current_price * (1 + (stop_multiplier * 0.015))
                         take_profit = current_price * (1 - (profit_multiplier * 0.02))
                         
-                    signals.append({
+                    signals_by_type.setdefault(signal_data["signal"], []).append({
                         "strategy": strategy_name,
                         "signal": signal_data["signal"],
                         "confidence": signal_data["confidence"],
@@ -68,13 +69,13 @@ class RecommendationEngine:
                         "take_profit": take_profit,
                     })
             
-            if not signals:
+            if not signals_by_type:
                 continue
             
             # Determine consensus action
-            long_signals = [s for s in signals if s["signal"] == "long"]
-            short_signals = [s for s in signals if s["signal"] == "short"]
-            exit_signals = [s for s in signals if s["signal"] == "exit"]
+            long_signals = signals_by_type.get("long", [])
+            short_signals = signals_by_type.get("short", [])
+            exit_signals = signals_by_type.get("exit", [])
             
             if long_signals and len(long_signals) > len(short_signals):
                 action = "BUY"
@@ -99,7 +100,6 @@ class RecommendationEngine:
             details = " | ".join(f"{s['strategy']}: {s['details']}" for s in supporting_signals)
             
             # Calculate position size based on account risk
-            risk_per_trade = self.account_size * 0.02  # 2% risk per trade
             entry_price = supporting_signals[0]["entry_price"]
             stop_loss = supporting_signals[0]["stop_loss"]
             take_profit = supporting_signals[0]["take_profit"]
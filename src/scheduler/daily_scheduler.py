@@ -355,7 +355,10 @@ class DailyReportGenerator:
                     report_lines.append(f"- {symbol}: {return_val:.2%}")
                 
                 report_lines.append(f"**Worst Performers:**")
-                for symbol, return_val in sorted_returns[-5:]:
+                # Walk the tail by index rather than copying it out with a slice
+                count = len(sorted_returns)
+                for i in range(max(0, count - 5), count):
+                    symbol, return_val = sorted_returns[i]
                     report_lines.append(f"- {symbol}: {return_val:.2%}")
                 report_lines.append("")
         
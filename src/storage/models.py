@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
+from operator import attrgetter
 import json
 
 @dataclass
@@ -62,13 +63,18 @@ class DailySnapshot:
     
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict(), default=str)
+        # Field values are JSON-ready, so skip asdict()'s recursive deep copy
+        return json.dumps(dict(zip(_DAILY_SNAPSHOT_FIELDS, _get_daily_snapshot_values(self))), default=str)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'DailySnapshot':
         """Create from JSON string"""
         return cls.from_dict(json.loads(json_str))
 
+# Field order of DailySnapshot, resolved once at import time
+_DAILY_SNAPSHOT_FIELDS = tuple(f.name for f in fields(DailySnapshot))
+_get_daily_snapshot_values = attrgetter(*_DAILY_SNAPSHOT_FIELDS)
+
 @dataclass
 class StrategySignal:
     """Individual strategy signal data"""
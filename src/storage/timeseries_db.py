@@ -4,6 +4,8 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
 import logging
 
 from .models import DailySnapshot, StrategyTimeSeries, ComparisonMetrics, ProjectionData
@@ -94,7 +96,7 @@ class TimeSeriesDB:
     @contextmanager
     def get_connection(self):
         """Get database connection with proper cleanup"""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, cached_statements=256)
         conn.row_factory = sqlite3.Row  # Enable column access by name
         try:
             yield conn
@@ -176,6 +178,42 @@ class TimeSeriesDB:
             logger.error(f"Error getting symbol data for {symbol}: {e}")
             return []
     
+    def get_multi_symbol_data(self, symbols: List[str], start_date: Optional[str] = None,
+                              end_date: Optional[str] = None) -> Dict[str, List[DailySnapshot]]:
+        """Get data for several symbols within date range using a single query"""
+        if not symbols:
+            return {}
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                placeholders = ','.join(['?' for _ in symbols])
+                query = f"SELECT symbol, data FROM daily_snapshots WHERE symbol IN ({placeholders})"
+                params = list(symbols)
+                
+                if start_date:
+                    query += " AND date >= ?"
+                    params.append(start_date)
+                
+                if end_date:
+                    query += " AND date <= ?"
+                    params.append(end_date)
+                
+                query += " ORDER BY symbol, date ASC"
+                
+                cursor.execute(query, params)
+                
+                result = {symbol: [] for symbol in symbols}
+                for symbol, rows in groupby(cursor.fetchall(), key=itemgetter('symbol')):
+                    result[symbol] = [DailySnapshot.from_json(row['data']) for row in rows]
+                
+                return result
+                
+        except Exception as e:
+            logger.error(f"Error getting multi-symbol data for {symbols}: {e}")
+            return {}
+    
     def get_date_data(self, date: str, symbols: Optional[List[str]] = None) -> List[DailySnapshot]:
         """Get all symbols data for a specific date"""
         try:
@@ -83,7 +83,7 @@ class BollingerBandsStrategy(Strategy):
                 continue
             
             # Calculate Bollinger Bands
-            closes = np.array([p.close for p in historical.data_points[-self.period:]])
+            closes = historical.column('close')[-self.period:]
             middle_band = np.mean(closes)
             std = np.std(closes)
             upper_band = middle_band + (self.std_dev * std)
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-from .strategy import Strategy, SignalType
+from .strategy import Strategy, SignalType, parse_date
 import numpy as np
 from market_data.data_types import BacktestResult, TradeMetrics, Trade, HistoricalData
 
@@ -27,7 +27,21 @@ class EnsembleStrategy(Strategy):
         """Add data to all underlying strategies"""
         super().add_data(symbol, historical, fundamental)
         for strategy in self.strategies:
-            strategy.add_data(symbol, historical, fundamental)
+            # Children are usually the same instances main() already fed; they share one reference
+            if strategy.data.get(symbol) is not historical:
+                strategy.add_data(symbol, historical, fundamental)
+    
+    def parameters(self) -> Dict[str, object]:
+        """Own settings plus each underlying strategy's, since they all shape the combined signal"""
+        parameters = super().parameters()
+        parameters['strategies'] = {strategy.name: strategy.parameters() for strategy in self.strategies}
+        return parameters
+    
+    def for_symbols(self, symbols: List[str]) -> 'EnsembleStrategy':
+        """Shallow copy restricted to the given symbols, including the underlying strategies"""
+        subset = super().for_symbols(symbols)
+        subset.strategies = [strategy.for_symbols(symbols) for strategy in self.strategies]
+        return subset
     
     def _evaluate_strategy_performance(self, symbol: str, date: datetime) -> None:
         """Evaluate recent performance of each strategy and adjust weights"""
@@ -35,7 +49,7 @@ class EnsembleStrategy(Strategy):
         
         # Get historical data points within evaluation window
         end_idx = next((i for i, p in enumerate(historical.data_points) 
-                       if datetime.strptime(p.date, '%Y-%m-%d') > date), len(historical.data_points))
+                       if parse_date(p.date) > date), len(historical.data_points))
         start_idx = max(0, end_idx - self.evaluation_window)
         evaluation_points = historical.data_points[start_idx:end_idx]
         
@@ -53,7 +67,7 @@ class EnsembleStrategy(Strategy):
             entry_price = 0
             
             for point in evaluation_points:
-                point_date = datetime.strptime(point.date, '%Y-%m-%d')
+                point_date = parse_date(point.date)
                 signal = strategy.analyze(point_date)[symbol]
                 
                 if signal['signal'] == "long" and position == "none":
@@ -154,15 +168,20 @@ class EnsembleStrategy(Strategy):
         return "hold", 0.0, "No clear consensus"
     
     def analyze(self, date: Optional[datetime] = None) -> Dict[str, Dict[str, any]]:
+        # Each underlying analysis covers every symbol, so run it once rather than once per symbol
+        return self.combine_analyses({strategy.name: strategy.analyze(date) for strategy in self.strategies})
+    
+    def combine_analyses(self, strategy_analyses: Dict[str, Dict[str, Dict[str, any]]]) -> Dict[str, Dict[str, any]]:
+        """Combine already computed analyze() results of the underlying strategies, keyed by strategy name"""
         results = {}
+        analyses = [(strategy, strategy_analyses[strategy.name]) for strategy in self.strategies]
         
         for symbol in self.symbols:
             historical, _ = self.get_data(symbol)
             
             # Collect and combine signals from all strategies
             strategy_signals = []
-            for strategy in self.strategies:
-                analysis = strategy.analyze(date)
+            for strategy, analysis in analyses:
                 if symbol in analysis:
                     signal_data = analysis[symbol]
                     if signal_data["signal"] != "hold":  # Only include non-hold signals
@@ -236,13 +255,18 @@ class EnsembleStrategy(Strategy):
     
     def backtest(self, start_date: datetime, end_date: datetime) -> Dict[str, BacktestResult]:
         """Run strategy backtest"""
-        results = {}
-        
         # Get backtest results from all strategies
         strategy_results = {}
         for strategy in self.strategies:
             strategy_results[strategy.name] = strategy.backtest(start_date, end_date)
         
+        return self.combine_backtests(strategy_results, start_date, end_date)
+    
+    def combine_backtests(self, strategy_results: Dict[str, Dict[str, BacktestResult]],
+                          start_date: datetime, end_date: datetime) -> Dict[str, BacktestResult]:
+        """Combine already computed backtest() results of the underlying strategies, keyed by strategy name"""
+        results = {}
+        
         # Process each symbol
         for symbol in self.symbols:
             all_trades: List[Trade] = []
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from .strategy import Strategy, SignalType
+from .strategy import Strategy, SignalType, parse_date
 import numpy as np
 from market_data.data_types import BacktestResult, TradeMetrics, Trade, HistoricalData
 
@@ -116,7 +116,7 @@ class MACDStrategy(Strategy):
         
         for symbol in self.symbols:
             historical, _ = self.get_data(symbol)
-            close_prices = [point.close for point in historical.data_points]
+            close_prices = historical.column('close')
             
             if len(close_prices) < self.slow_period:
                 results[symbol] = {
@@ -188,7 +188,7 @@ class MACDStrategy(Strategy):
             # Get data points in date range
             data_points = [
                 point for point in historical.data_points
-                if start_date <= datetime.strptime(point.date, '%Y-%m-%d') <= end_date
+                if start_date <= parse_date(point.date) <= end_date
             ]
             
             if len(data_points) < self.slow_period + self.signal_period:
@@ -215,7 +215,7 @@ class MACDStrategy(Strategy):
             # Process each day
             for i in range(self.slow_period + self.signal_period, len(data_points)):
                 point = data_points[i]
-                date = datetime.strptime(point.date, '%Y-%m-%d')
+                date = parse_date(point.date)
                 
                 current_hist = histogram[i]
                 prev_hist = histogram[i-1]
@@ -247,7 +247,7 @@ class MACDStrategy(Strategy):
                 trades.append(Trade(
                     entry_date=position['entry_date'],
                     entry_price=position['entry_price'],
-                    exit_date=datetime.strptime(last_point.date, '%Y-%m-%d'),
+                    exit_date=parse_date(last_point.date),
                     exit_price=last_point.close,
                     type=position['type'],
                     pnl=(last_point.close - position['entry_price']) * position['size'],
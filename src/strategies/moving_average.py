@@ -70,9 +70,9 @@ class MovingAverageStrategy(Strategy):
             historical, _ = self.get_data(symbol)
             
             # Calculate SMAs
-            closes = [point.close for point in historical.data_points]
-            sma_50 = sum(closes[-50:]) / min(50, len(closes))
-            sma_200 = sum(closes[-200:]) / min(200, len(closes))
+            closes = historical.column('close')
+            sma_50 = closes[-50:].mean()
+            sma_200 = closes[-200:].mean()
             
             # Determine signal
             signal: SignalType = "hold"
@@ -84,8 +84,8 @@ class MovingAverageStrategy(Strategy):
                 
                 # Previous day's values for crossover detection
                 prev_closes = closes[:-1]
-                prev_sma_50 = sum(prev_closes[-50:]) / min(50, len(prev_closes))
-                prev_sma_200 = sum(prev_closes[-200:]) / min(200, len(prev_closes))
+                prev_sma_50 = prev_closes[-50:].mean()
+                prev_sma_200 = prev_closes[-200:].mean()
                 prev_spread = (prev_sma_50 - prev_sma_200) / prev_sma_200
                 
                 # Detect crossovers
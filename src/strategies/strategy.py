@@ -1,13 +1,25 @@
 from abc import ABC, abstractmethod
+import copy
+from collections import Counter
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Literal
 from datetime import datetime
 from market_data.data_types import HistoricalData, FundamentalData, BacktestResult, TradeMetrics, Trade
 
 SignalType = Literal["long", "short", "exit", "hold"]
 
+@lru_cache(maxsize=8192)
+def parse_date(value: str) -> datetime:
+    """Parse a 'YYYY-MM-DD' data point date, memoized across strategies and runs"""
+    return datetime.strptime(value, '%Y-%m-%d')
+
 class Strategy(ABC):
     """Base class for all trading strategies"""
     
+    # Whether each symbol is analyzed/backtested independently of the others,
+    # so the symbol set can be split across worker processes
+    symbols_independent = True
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
@@ -21,12 +33,25 @@ class Strategy(ABC):
     
     def add_data(self, symbol: str, historical: HistoricalData, fundamental: Optional[FundamentalData] = None):
         """Add market data for a symbol"""
-        if symbol not in self._symbols:
+        if symbol not in self.data:  # dict lookup; data and _symbols are kept in step
             self._symbols.append(symbol)
         self.data[symbol] = historical
         if fundamental:
             self.fundamentals[symbol] = fundamental
     
+    def for_symbols(self, symbols: List[str]) -> 'Strategy':
+        """Shallow copy of this strategy holding only the given symbols' data"""
+        subset = copy.copy(self)
+        subset._symbols = list(symbols)
+        subset.data = {symbol: self.data[symbol] for symbol in symbols}
+        subset.fundamentals = {symbol: self.fundamentals[symbol] for symbol in symbols if symbol in self.fundamentals}
+        return subset
+    
+    def parameters(self) -> Dict[str, object]:
+        """Scalar settings (periods, thresholds, targets) that determine this strategy's results"""
+        return {key: value for key, value in vars(self).items()
+                if not key.startswith('_') and isinstance(value, (bool, int, float, str))}
+    
     @property
     def symbols(self) -> List[str]:
         """Get available symbols"""
@@ -47,7 +72,7 @@ class Strategy(ABC):
         end_price = None
         
         for point in historical.data_points:
-            point_date = datetime.strptime(point.date, '%Y-%m-%d')
+            point_date = parse_date(point.date)
             if point_date >= start_date and start_price is None:
                 start_price = point.close
             if point_date <= end_date:
@@ -149,13 +174,22 @@ class Strategy(ABC):
                 "strategy_returns": self.calculate_strategy_returns(trades, symbol)
             }
         
-        long_signals = sum(1 for t in trades if t['signal'] == 'long')
-        short_signals = sum(1 for t in trades if t['signal'] == 'short')
-        exit_signals = sum(1 for t in trades if t['signal'] == 'exit')
-        confidences = [t['confidence'] for t in trades]
+        # Tally signals, confidences and the date range in a single pass over the trades
+        signal_counts = Counter()
+        confidences = []
+        first_date = last_date = trades[0]['date']
+        for t in trades:
+            signal_counts[t['signal']] += 1
+            confidences.append(t['confidence'])
+            trade_date = t['date']
+            if trade_date < first_date:
+                first_date = trade_date
+            elif trade_date > last_date:
+                last_date = trade_date
+        long_signals = signal_counts['long']
+        short_signals = signal_counts['short']
+        exit_signals = signal_counts['exit']
         
-        first_date = min(t['date'] for t in trades)
-        last_date = max(t['date'] for t in trades)
         period = f"{first_date.strftime('%Y-%m-%d')} to {last_date.strftime('%Y-%m-%d')}"
         
         # Let derived classes add their own metrics
@@ -195,70 +229,70 @@ class Strategy(ABC):
             # Get data points in date range
             data_points = [
                 point for point in historical.data_points
-                if start_date <= datetime.strptime(point.date, '%Y-%m-%d') <= end_date
+                if start_date <= parse_date(point.date) <= end_date
             ]
             
-            if len(data_points) < self.get_min_required_points():
+            min_points = self.get_min_required_points()
+            if len(data_points) < min_points:
                 results[symbol] = self.create_empty_result(symbol, start_date, end_date)
                 continue
             
             trades: List[Trade] = []
-            position = None
+            # Open position held in locals rather than a dict; this loop runs once per bar
+            position_type = None
+            entry_date = entry_price = stop_loss = profit_target = None
+            size = self.position_size
+            generate_signals = self.generate_signals
             
             # Process each day
-            for i in range(self.get_min_required_points(), len(data_points)):
+            for i in range(min_points, len(data_points)):
                 point = data_points[i]
-                date = datetime.strptime(point.date, '%Y-%m-%d')
                 current_close = point.close
                 
-                signal, confidence, details = self.generate_signals(data_points, i)
+                signal, confidence, details = generate_signals(data_points, i)
                 
                 # Handle entry signals
-                if position is None and signal in ['long', 'short']:
-                    position = {
-                        'type': signal,
-                        'entry_date': date,
-                        'entry_price': current_close,
-                        'size': self.position_size,
-                        'stop_loss': current_close * (1 - self.stop_loss if signal == 'long' else -self.stop_loss),
-                        'profit_target': current_close * (1 + self.profit_target if signal == 'long' else -self.profit_target)
-                    }
+                if position_type is None:
+                    if signal == 'long' or signal == 'short':
+                        position_type = signal
+                        entry_date = parse_date(point.date)
+                        entry_price = current_close
+                        stop_loss = current_close * (1 - self.stop_loss if signal == 'long' else -self.stop_loss)
+                        profit_target = current_close * (1 + self.profit_target if signal == 'long' else -self.profit_target)
                 
                 # Handle exit signals
-                elif position is not None:
-                    should_exit = signal == 'exit'
-                    
+                else:
                     # Check stop loss and profit target
-                    if position['type'] == 'long':
-                        should_exit = should_exit or current_close <= position['stop_loss'] or current_close >= position['profit_target']
+                    if position_type == 'long':
+                        should_exit = signal == 'exit' or current_close <= stop_loss or current_close >= profit_target
                     else:  # short position
-                        should_exit = should_exit or current_close >= position['stop_loss'] or current_close <= position['profit_target']
+                        should_exit = signal == 'exit' or current_close >= stop_loss or current_close <= profit_target
                     
                     if should_exit:
                         trades.append(Trade(
-                            entry_date=position['entry_date'],
-                            entry_price=position['entry_price'],
-                            exit_date=date,
+                            entry_date=entry_date,
+                            entry_price=entry_price,
+                            exit_date=parse_date(point.date),
                             exit_price=current_close,
-                            type=position['type'],
-                            pnl=self.calculate_pnl(position['type'], current_close, position['entry_price'], position['size']),
-                            return_pct=self.calculate_return(position['type'], current_close, position['entry_price']),
-                            size=position['size']
+                            type=position_type,
+                            pnl=self.calculate_pnl(position_type, current_close, entry_price, size),
+                            return_pct=self.calculate_return(position_type, current_close, entry_price),
+                            size=size
                         ))
-                        position = None
+                        position_type = None
             
             # Close any open position at the end
-            if position is not None:
+            if position_type is not None:
                 last_point = data_points[-1]
                 trades.append(Trade(
-                    entry_date=position['entry_date'],
-                    entry_price=position['entry_price'],
-                    exit_date=datetime.strptime(last_point.date, '%Y-%m-%d'),
+                    entry_date=entry_date,
+                    entry_price=entry_price,
+                    exit_date=parse_date(last_point.date),
                     exit_price=last_point.close,
-                    type=position['type'],
-                    pnl=self.calculate_pnl(position['type'], last_point.close, position['entry_price'], position['size']),
-                    return_pct=self.calculate_return(position['type'], last_point.close, position['entry_price']),
-                    size=position['size']
+                    type=position_type,
+                    pnl=self.calculate_pnl(position_type, last_point.close, entry_price, size),
+                    return_pct=self.calculate_return(position_type, last_point.close, entry_price),
+                    size=size
                 ))
             
             results[symbol] = self.create_backtest_result(trades, symbol, start_date, end_date)
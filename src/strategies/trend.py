@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from .strategy import Strategy, SignalType
+from .strategy import Strategy, SignalType, parse_date
 import numpy as np
 from market_data.data_types import BacktestResult, TradeMetrics, Trade, HistoricalData
 
@@ -149,17 +149,18 @@ class TrendFollowingStrategy(Strategy):
                 }
                 continue
             
-            # Prepare price data
-            closes = [point.close for point in historical.data_points]
-            highs = [point.high for point in historical.data_points]
-            lows = [point.low for point in historical.data_points]
+            # Prepare price data (cached column arrays shared across strategies)
+            closes = historical.close
+            highs = historical.high
+            lows = historical.low
             
             # Calculate using the appropriate window of data
             window_closes = closes[-self.trend_period-1:]  # Get enough points for trend calculation
             trend_strength, uptrend = self._calculate_trend_strength(window_closes, self.trend_period)
             
-            # Calculate indicators
-            atr = self._calculate_atr(highs, lows, closes, self.atr_period)
+            # Calculate indicators; only the latest ATR is used, which needs just the last period + 1 bars
+            atr_window = slice(-(self.atr_period + 1), None)
+            atr = self._calculate_atr(highs[atr_window], lows[atr_window], closes[atr_window], self.atr_period)
             support, resistance = self._calculate_support_resistance(highs, lows, self.trend_period)
             
             current_close = closes[-1]
@@ -221,7 +222,7 @@ class TrendFollowingStrategy(Strategy):
             # Get data points in date range
             data_points = [
                 point for point in historical.data_points
-                if start_date <= datetime.strptime(point.date, '%Y-%m-%d') <= end_date
+                if start_date <= parse_date(point.date) <= end_date
             ]
             
             if len(data_points) < self.trend_period:
@@ -254,7 +255,7 @@ class TrendFollowingStrategy(Strategy):
                 
                 current_close = closes[-1]
                 point = data_points[i]
-                date = datetime.strptime(point.date, '%Y-%m-%d')
+                date = parse_date(point.date)
                 
                 # Generate signals
                 if position is None:  # Look for entry signals
@@ -326,7 +327,7 @@ class TrendFollowingStrategy(Strategy):
                 trades.append(Trade(
                     entry_date=position['entry_date'],
                     entry_price=position['entry_price'],
-                    exit_date=datetime.strptime(last_point.date, '%Y-%m-%d'),
+                    exit_date=parse_date(last_point.date),
                     exit_price=last_close,
                     type=position['type'],
                     pnl=(last_close - position['entry_price']) * position['size'] if position['type'] == 'long'